@@ -7,20 +7,70 @@ from __future__ import annotations
 
 import argparse
 import base64
+import hashlib
+import io
 import json
 import os
+import random
+import re
 import sys
-import urllib.error
-import urllib.request
+import threading
+import time
+import urllib.parse
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, replace
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterator
+
+import requests
+
+try:
+    import orjson
+except ModuleNotFoundError:  # Optional: faster parsing of large dom.json captures.
+    orjson = None
+
+try:
+    from PIL import Image
+except ModuleNotFoundError:  # Optional: downscale screenshots before upload.
+    Image = None
 
 
 DEFAULT_MODEL = "gpt-4.1-mini"
 DEFAULT_ENDPOINT = "https://api.openai.com/v1/responses"
 DEFAULT_XAI_MODEL = "grok-2-vision-latest"
 DEFAULT_XAI_ENDPOINT = "https://api.x.ai/v1/responses"
+DEFAULT_CONCURRENCY = 8
+DEFAULT_BATCH_SIZE = 1
+DEFAULT_MAX_OUTPUT_TOKENS = 1024
+DEFAULT_CONNECT_TIMEOUT = 5.0
+DEFAULT_READ_TIMEOUT = 120.0
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_MAX_IMAGE_DIM = 1536
+DEFAULT_REQUIRE_DOM_CHARS = 50
+DOWNSCALED_IMAGE_QUALITY = 85
+RETRY_INITIAL_DELAY_SECONDS = 1.0
+RETRY_MAX_DELAY_SECONDS = 20.0
+RETRYABLE_HTTP_STATUSES = frozenset({408, 409, 429, 500, 502, 503, 504})
+DOM_READ_CHUNK_CHARS = 64 * 1024
+# Longest JSON encoding of one character: a \uXXXX\uXXXX surrogate pair.
+MAX_JSON_CHARS_PER_CHAR = 12
+# Multiple of 3 so each chunk base64-encodes without padding.
+B64_READ_CHUNK_BYTES = 3 * 64 * 1024
+
+
+@dataclass(frozen=True)
+class ApiRequestSettings:
+    max_output_tokens: int = DEFAULT_MAX_OUTPUT_TOKENS
+    connect_timeout: float = DEFAULT_CONNECT_TIMEOUT
+    read_timeout: float = DEFAULT_READ_TIMEOUT
+    max_retries: int = DEFAULT_MAX_RETRIES
+    response_cache_dir: Path | None = None
+    response_cache_ttl: float | None = None
+    # Skip cache lookups but still store the fresh answer (overwrites the entry).
+    refresh_response_cache: bool = False
+    stream: bool = False
 
 
 def normalize_provider(provider: str) -> str:
@@ -115,6 +165,113 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Analyze each page separately instead of combining.",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=(
+            "Maximum number of in-flight Responses API requests when analyzing per page. "
+            f"Default: {DEFAULT_CONCURRENCY}"
+        ),
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help=(
+            "Number of pages sent per Responses API request when analyzing per page. "
+            f"Default: {DEFAULT_BATCH_SIZE}"
+        ),
+    )
+    parser.add_argument(
+        "--max-output-tokens",
+        type=int,
+        default=DEFAULT_MAX_OUTPUT_TOKENS,
+        help=(
+            "Upper bound on tokens generated per page analyzed; combined and batched requests "
+            f"get this times their page count. Default: {DEFAULT_MAX_OUTPUT_TOKENS}"
+        ),
+    )
+    parser.add_argument(
+        "--connect-timeout",
+        type=float,
+        default=DEFAULT_CONNECT_TIMEOUT,
+        help=f"Seconds to wait when connecting to the API. Default: {DEFAULT_CONNECT_TIMEOUT:g}",
+    )
+    parser.add_argument(
+        "--read-timeout",
+        type=float,
+        default=DEFAULT_READ_TIMEOUT,
+        help=f"Seconds to wait for API response data. Default: {DEFAULT_READ_TIMEOUT:g}",
+    )
+    parser.add_argument(
+        "--max-retries",
+        type=int,
+        default=DEFAULT_MAX_RETRIES,
+        help=(
+            "Retries for transient API failures (429/5xx, timeouts, connection errors). "
+            f"Default: {DEFAULT_MAX_RETRIES}"
+        ),
+    )
+    parser.add_argument(
+        "--max-image-dim",
+        type=int,
+        default=DEFAULT_MAX_IMAGE_DIM,
+        help=(
+            "Downscale screenshots whose longest side exceeds this many pixels before upload "
+            f"(requires Pillow; 0 disables). Default: {DEFAULT_MAX_IMAGE_DIM}"
+        ),
+    )
+    parser.add_argument(
+        "--require-dom-chars",
+        type=int,
+        default=DEFAULT_REQUIRE_DOM_CHARS,
+        help=(
+            "In per-page mode, skip the model call for pages that reported a readiness error "
+            f"and have fewer DOM text characters than this (0 disables). "
+            f"Default: {DEFAULT_REQUIRE_DOM_CHARS}"
+        ),
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help=(
+            "Re-analyze per-page targets even when analysis.json is newer than the capture "
+            "and was produced by the same model, prompts, and size limits, and call the API "
+            "instead of reusing cached answers (fresh answers still replace the cache entries)."
+        ),
+    )
+    parser.add_argument(
+        "--cpu-workers",
+        type=int,
+        default=0,
+        help=(
+            "Worker processes for downscaling and base64-encoding screenshots before analysis "
+            "(default: 0, encode in the analysis threads)."
+        ),
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help=(
+            "Use streaming responses; the read timeout then applies between streamed events "
+            "instead of to the whole generation."
+        ),
+    )
+    parser.add_argument(
+        "--response-cache-ttl",
+        type=float,
+        default=None,
+        help="Ignore cached answers older than this many hours (default: cached answers never expire).",
+    )
+    parser.add_argument(
+        "--no-response-cache",
+        action="store_true",
+        help=(
+            "Neither read nor write the response cache of answers to identical requests under "
+            "$XDG_CACHE_HOME/whistleblower/analyses (default ~/.cache)."
+        ),
+    )
     parser.add_argument(
         "--env-file",
         default=".private/openai.env",
@@ -145,33 +302,47 @@ def parse_iso_utc(value: str | None) -> datetime | None:
     return parsed.astimezone(timezone.utc)
 
 
+RUN_DIR_NAME_RE = re.compile(r"(\d{4})(\d{2})(\d{2})-(\d{2})(\d{2})(\d{2})", re.ASCII)
+
+
 def parse_run_dir_timestamp(run_dir: Path) -> datetime | None:
+    # A fixed-width regex is much cheaper than strptime, which re-interprets
+    # its format string on every call; this runs once per run directory.
+    match = RUN_DIR_NAME_RE.fullmatch(run_dir.name)
+    if match is None:
+        return None
     try:
-        return datetime.strptime(run_dir.name, "%Y%m%d-%H%M%S").replace(tzinfo=timezone.utc)
+        return datetime(*map(int, match.groups()), tzinfo=timezone.utc)
     except ValueError:
         return None
 
 
+def subdir_names(path: Path) -> list[str]:
+    """Names of the directories directly under `path` (one scandir, no extra stats)."""
+    with os.scandir(path) as entries:
+        return [entry.name for entry in entries if entry.is_dir()]
+
+
 def find_latest_run(data_dir: Path, site: str | None) -> Path:
     if site is not None:
         site_dir = data_dir / site
         if not site_dir.exists():
             raise ValueError(f"Site directory not found: {site_dir}")
-        runs = sorted([p for p in site_dir.iterdir() if p.is_dir()])
-        if not runs:
+        run_names = subdir_names(site_dir)
+        if not run_names:
             raise ValueError(f"No runs found under: {site_dir}")
-        return runs[-1]
-
-    candidates: list[Path] = []
-    for site_dir in data_dir.iterdir():
-        if not site_dir.is_dir():
-            continue
-        for run_dir in site_dir.iterdir():
-            if run_dir.is_dir():
-                candidates.append(run_dir)
-    if not candidates:
+        return site_dir / max(run_names)
+
+    latest: tuple[str, str] | None = None
+    for site_name in subdir_names(data_dir):
+        run_names = subdir_names(data_dir / site_name)
+        if run_names:
+            candidate = (site_name, max(run_names))
+            if latest is None or candidate > latest:
+                latest = candidate
+    if latest is None:
         raise ValueError(f"No runs found under: {data_dir}")
-    return sorted(candidates)[-1]
+    return data_dir / latest[0] / latest[1]
 
 
 def find_runs_in_range(
@@ -185,15 +356,23 @@ def find_runs_in_range(
     if site is not None:
         site_dirs = [data_dir / site]
     else:
-        site_dirs = [p for p in data_dir.iterdir() if p.is_dir()]
+        site_dirs = [data_dir / name for name in subdir_names(data_dir)]
+
+    # Run names sort the same way as their timestamps, so whole-second bounds
+    # rule out most directories by string comparison before any parsing.
+    start_name = start.strftime("%Y%m%d-%H%M%S") if start is not None else None
+    end_name = end.strftime("%Y%m%d-%H%M%S") if end is not None else None
 
     runs: list[tuple[datetime, Path]] = []
     for site_dir in site_dirs:
         if not site_dir.exists():
             continue
-        for run_dir in site_dir.iterdir():
-            if not run_dir.is_dir():
+        for name in subdir_names(site_dir):
+            if start_name is not None and name < start_name:
                 continue
+            if end_name is not None and name > end_name:
+                continue
+            run_dir = site_dir / name
             ts = parse_run_dir_timestamp(run_dir)
             if ts is None:
                 continue
@@ -206,9 +385,340 @@ def find_runs_in_range(
     return [item[1] for item in sorted(runs, key=lambda item: item[0])]
 
 
+def parse_json_bytes(raw: bytes) -> Any:
+    """Parse UTF-8 JSON bytes without an intermediate str, using orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def load_json_file(path: Path) -> Any:
+    return parse_json_bytes(path.read_bytes())
+
+
+def dump_json_bytes(value: Any, indent: bool = False) -> bytes:
+    """Serialize `value` to UTF-8 JSON bytes, using orjson when it is installed.
+
+    Output is compact unless `indent` is set, which uses two-space indentation.
+    """
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(value, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def splice_json_strings(body: bytes, placeholders: list[str], values: list[str]) -> bytes:
+    """
+    Replace each placeholder string value in encoded JSON `body` with the matching value.
+
+    Placeholders must appear in order and be unique. Values that need no JSON
+    escaping (such as base64 data URLs) are copied in as-is.
+    """
+    pieces: list[bytes] = []
+    pos = 0
+    for placeholder, value in zip(placeholders, values):
+        token = f'"{placeholder}"'.encode("ascii")
+        index = body.index(token, pos)
+        pieces.append(body[pos : index + 1])
+        if value.isascii() and value.isprintable() and '"' not in value and "\\" not in value:
+            pieces.append(value.encode("ascii"))
+        else:
+            pieces.append(dump_json_bytes(value)[1:-1])
+        pos = index + len(token) - 1
+    pieces.append(body[pos:])
+    return b"".join(pieces)
+
+
+class NeedMoreData(Exception):
+    """Raised while scanning a partial JSON buffer that ends too early."""
+
+
+def decode_json_string_prefix(buf: str, start: int, max_chars: int, at_eof: bool) -> str:
+    """Decode at most `max_chars` of the JSON string whose opening quote is at `start`."""
+    try:
+        value, _ = json.decoder.scanstring(buf, start + 1)
+        return value[:max_chars]
+    except json.JSONDecodeError:
+        if at_eof:
+            raise
+    raw = buf[start + 1 : start + 1 + (max_chars + 2) * MAX_JSON_CHARS_PER_CHAR]
+    if len(buf) - start - 1 <= len(raw):
+        raise NeedMoreData
+    # Trim until the cut no longer splits an escape sequence.
+    for trim in range(MAX_JSON_CHARS_PER_CHAR + 1):
+        try:
+            value, _ = json.decoder.scanstring(raw[: len(raw) - trim] + '"', 0)
+            return value[:max_chars]
+        except json.JSONDecodeError:
+            continue
+    raise ValueError("Could not decode DOM text prefix")
+
+
+def scan_dom_text(buf: str, max_chars: int, at_eof: bool) -> str:
+    """Find the top-level "text" value in a (possibly partial) dom.json buffer."""
+    decoder = json.JSONDecoder()
+    whitespace = json.decoder.WHITESPACE
+
+    def skip_ws(pos: int) -> int:
+        pos = whitespace.match(buf, pos).end()
+        if pos >= len(buf):
+            raise NeedMoreData
+        return pos
+
+    try:
+        pos = skip_ws(0)
+        if buf[pos] != "{":
+            raise ValueError("dom.json is not a JSON object")
+        pos += 1
+        while True:
+            pos = skip_ws(pos)
+            if buf[pos] == "}":
+                return ""
+            key, pos = json.decoder.scanstring(buf, pos + 1)
+            pos = skip_ws(pos)
+            if buf[pos] != ":":
+                raise ValueError("Malformed dom.json object")
+            pos = skip_ws(pos + 1)
+            if key == "text":
+                if buf[pos] == '"':
+                    return decode_json_string_prefix(buf, pos, max_chars, at_eof)
+                value, _ = decoder.raw_decode(buf, pos)
+                return str(value or "")[:max_chars]
+            _, pos = decoder.raw_decode(buf, pos)
+            pos = skip_ws(pos)
+            if buf[pos] == "}":
+                return ""
+            if buf[pos] != ",":
+                raise ValueError("Malformed dom.json object")
+            pos += 1
+    except json.JSONDecodeError:
+        if at_eof:
+            raise
+        raise NeedMoreData from None
+
+
+def read_dom_text_excerpt(dom_path: Path, max_chars: int) -> str:
+    """
+    Return the first `max_chars` characters of dom.json's top-level "text".
+
+    whistleblower.py writes "text" ahead of the (potentially huge) "states"
+    array, so only the start of the file is usually read and decoded. Files
+    that cannot be scanned incrementally fall back to a full parse.
+    """
+    if max_chars <= 0:
+        return ""
+    try:
+        with dom_path.open(encoding="utf-8") as handle:
+            buf = ""
+            chunk_chars = DOM_READ_CHUNK_CHARS
+            while True:
+                chunk = handle.read(chunk_chars)
+                buf += chunk
+                try:
+                    return scan_dom_text(buf, max_chars, at_eof=not chunk)
+                except NeedMoreData:
+                    if not chunk:
+                        break
+                    chunk_chars *= 2
+    except ValueError:
+        pass
+    dom = load_json_file(dom_path)
+    return str(dom.get("text") or "")[:max_chars] if isinstance(dom, dict) else ""
+
+
+def write_bytes_atomic(path: Path, data: bytes) -> None:
+    """Write `data` to a temp file beside `path`, then rename it into place."""
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    try:
+        fd = os.open(tmp_path, flags, 0o666)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view) :]
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def write_text_atomic(path: Path, text: str, encoding: str = "utf-8") -> None:
+    write_bytes_atomic(path, text.encode(encoding))
+
+
+class StreamedTextFile:
+    """
+    Write streamed text deltas to a temp file beside `path` as they arrive.
+
+    commit() replaces the temp file's content with the final text and renames
+    it over `path`, so `path` itself only ever holds a complete analysis. Used
+    as a context manager, an uncommitted temp file is removed on exit.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        self.handle: io.TextIOWrapper | None = None
+
+    def write(self, delta: str) -> None:
+        if self.handle is None:
+            self.handle = self.tmp_path.open("w", encoding="utf-8", newline="")
+        self.handle.write(delta)
+        self.handle.flush()
+
+    def commit(self, text: str) -> None:
+        if self.handle is None:
+            # Nothing was streamed (e.g. a cached answer); write it in one go.
+            write_text_atomic(self.path, text)
+            return
+        try:
+            self.handle.seek(0)
+            self.handle.write(text)
+            self.handle.truncate()
+            self.handle.close()
+            os.replace(self.tmp_path, self.path)
+        except BaseException:
+            self.discard()
+            raise
+
+    def discard(self) -> None:
+        if self.handle is not None:
+            self.handle.close()
+        self.tmp_path.unlink(missing_ok=True)
+
+    def __enter__(self) -> StreamedTextFile:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.discard()
+
+
+def default_response_cache_dir() -> Path:
+    cache_root = os.getenv("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(cache_root) / "whistleblower" / "analyses"
+
+
 def b64_data_url(path: Path) -> str:
-    encoded = base64.b64encode(path.read_bytes()).decode("ascii")
-    return f"data:image/png;base64,{encoded}"
+    # Encode chunk by chunk into one buffer rather than holding the raw PNG,
+    # its base64 bytes, and the final string in memory at the same time.
+    encoded = bytearray(b"data:image/png;base64,")
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(B64_READ_CHUNK_BYTES), b""):
+            encoded += base64.b64encode(chunk)
+    return encoded.decode("ascii")
+
+
+def downscaled_data_url(path: Path, max_image_dim: int) -> str | None:
+    """
+    Return a JPEG data URL of `path` shrunk to fit `max_image_dim`, or None.
+
+    None means the image is already small enough, or Pillow is not installed.
+    JPEG is used because both the OpenAI and xAI image inputs accept it.
+    """
+    if Image is None:
+        return None
+    with Image.open(path) as image:
+        if max(image.size) <= max_image_dim:
+            return None
+        image.thumbnail((max_image_dim, max_image_dim), Image.Resampling.LANCZOS)
+        buffer = io.BytesIO()
+        image.convert("RGB").save(
+            buffer, format="JPEG", quality=DOWNSCALED_IMAGE_QUALITY, optimize=True
+        )
+    encoded = bytearray(b"data:image/jpeg;base64,")
+    encoded += base64.b64encode(buffer.getbuffer())
+    del buffer
+    return encoded.decode("ascii")
+
+
+def screenshot_data_url(path: Path, max_image_dim: int | None = None) -> str:
+    """Data URL for a screenshot, downscaled when it exceeds `max_image_dim`."""
+    if max_image_dim:
+        try:
+            downscaled = downscaled_data_url(path, max_image_dim)
+        except (OSError, ValueError) as exc:
+            print(f"WARNING: Could not downscale {path}, sending original: {exc}", file=sys.stderr)
+            downscaled = None
+        if downscaled is not None:
+            return downscaled
+    return b64_data_url(path)
+
+
+def screenshot_cache_key(path: Path, max_image_dim: int | None = None) -> str:
+    """Key identifying one encoding of `path`: its mtime, size, and effective downscale limit."""
+    stat = path.stat()
+    downscale = max_image_dim if max_image_dim and Image is not None else 0
+    # The trailing format tag keeps caches from before the switch to JPEG from being reused.
+    return f"{stat.st_mtime_ns}:{stat.st_size}:{downscale}:jpeg"
+
+
+def screenshot_cache_is_current(path: Path, max_image_dim: int | None = None) -> bool:
+    cache_path = path.with_name(f"{path.name}.b64")
+    try:
+        with cache_path.open(encoding="ascii") as handle:
+            return handle.readline().rstrip("\n") == screenshot_cache_key(path, max_image_dim)
+    except (OSError, UnicodeDecodeError):
+        return False
+
+
+def warm_screenshot_cache(path: Path, max_image_dim: int | None = None) -> None:
+    """Build the `.b64` cache for `path`. Runs in a worker process, so it returns nothing."""
+    cached_b64_data_url(path, max_image_dim)
+
+
+def warm_screenshot_caches(
+    paths: list[Path], max_image_dim: int | None, cpu_workers: int
+) -> None:
+    """
+    Encode stale screenshot caches in parallel worker processes.
+
+    Downscaling and base64-encoding hold the GIL for much of their run, so
+    analysis threads encoding screenshots serialize on it. Workers write the
+    `.b64` caches that the analysis threads then read back cheaply. Any failure
+    here is ignored; the threads fall back to encoding in-process.
+    """
+    if cpu_workers <= 0:
+        return
+    stale = [path for path in paths if path.exists() and not screenshot_cache_is_current(path, max_image_dim)]
+    if len(stale) < 2:
+        return
+    try:
+        with ProcessPoolExecutor(max_workers=min(cpu_workers, len(stale))) as executor:
+            for future in [executor.submit(warm_screenshot_cache, path, max_image_dim) for path in stale]:
+                try:
+                    future.result()
+                except (OSError, ValueError):
+                    pass
+    except (BrokenProcessPool, OSError, NotImplementedError) as exc:
+        print(f"WARNING: Screenshot pre-encoding unavailable, encoding in-process: {exc}", file=sys.stderr)
+
+
+def cached_b64_data_url(path: Path, max_image_dim: int | None = None) -> str:
+    """
+    Return screenshot_data_url(path, max_image_dim), reusing a `<name>.b64` cache file.
+
+    The cache's first line records the image's mtime, size, and the dimension
+    limit, so a re-captured screenshot or a new limit invalidates it.
+    """
+    cache_key = screenshot_cache_key(path, max_image_dim)
+    cache_path = path.with_name(f"{path.name}.b64")
+    try:
+        with cache_path.open(encoding="ascii") as handle:
+            if handle.readline().rstrip("\n") == cache_key:
+                return handle.read()
+    except (OSError, UnicodeDecodeError):
+        pass
+
+    data_url = screenshot_data_url(path, max_image_dim)
+    try:
+        write_text_atomic(cache_path, f"{cache_key}\n{data_url}", encoding="ascii")
+    except OSError:
+        # The cache is best-effort; a read-only capture directory is fine.
+        pass
+    return data_url
 
 
 def parse_response_text(payload: dict[str, Any]) -> str:
@@ -229,6 +739,172 @@ def parse_response_text(payload: dict[str, Any]) -> str:
     return "\n\n".join(chunks).strip()
 
 
+def response_incomplete_reason(payload: dict[str, Any]) -> str | None:
+    """Why a response stopped early (e.g. max_output_tokens), or None if it completed."""
+    if payload.get("status") != "incomplete":
+        return None
+    details = payload.get("incomplete_details")
+    reason = details.get("reason") if isinstance(details, dict) else None
+    return str(reason or "unknown reason")
+
+
+def mark_incomplete(text: str, incomplete_reason: str | None) -> str:
+    """Append a visible note to an analysis the model stopped before finishing."""
+    if incomplete_reason is None:
+        return text
+    return (
+        f"{text}\n\n> Incomplete: the model stopped early ({incomplete_reason}). "
+        "Re-run the analysis for a complete answer."
+    )
+
+
+# One requests.Session per worker thread: Sessions are not documented as thread
+# safe. Each keeps its connections alive between requests, skipping a TCP + TLS
+# handshake for every request after the first, and applies proxy settings
+# (including no_proxy) from the environment.
+_http_state = threading.local()
+
+
+def http_session() -> requests.Session:
+    session = getattr(_http_state, "session", None)
+    if session is None:
+        session = _http_state.session = requests.Session()
+    return session
+
+
+def post_json_bytes(
+    endpoint: str,
+    body: bytes,
+    headers: dict[str, str],
+    connect_timeout: float,
+    read_timeout: float,
+    read_body: Callable[[requests.Response], Any] | None = None,
+) -> tuple[int, Any]:
+    """
+    POST `body` on this thread's session and return (status, response body).
+
+    When `read_body` is given the response is streamed, and successful responses
+    are consumed by it (its result is returned in place of the raw bytes); error
+    responses are always read whole.
+    """
+    parts = urllib.parse.urlsplit(endpoint)
+    if parts.scheme not in {"http", "https"} or not parts.hostname:
+        raise ValueError(f"Unsupported endpoint URL: {endpoint}")
+    with http_session().post(
+        endpoint,
+        data=body,
+        headers=headers,
+        timeout=(connect_timeout, read_timeout),
+        stream=read_body is not None,
+    ) as response:
+        if read_body is not None and response.status_code < 400:
+            data = read_body(response)
+            # Discard anything after the final event so the connection can be reused.
+            response.raw.drain_conn()
+            return response.status_code, data
+        return response.status_code, response.content
+
+
+def iter_sse_data(response: requests.Response) -> Iterator[bytes]:
+    """Yield the `data:` payload of each server-sent event in `response`."""
+    data_lines: list[bytes] = []
+    for line in response.iter_lines():
+        if not line:
+            if data_lines:
+                yield b"\n".join(data_lines)
+                data_lines = []
+        elif line.startswith(b"data:"):
+            data_lines.append(line[5:].removeprefix(b" "))
+    if data_lines:
+        yield b"\n".join(data_lines)
+
+
+def read_streamed_text(
+    response: requests.Response,
+    on_text_delta: Callable[[str], None] | None = None,
+) -> tuple[str, str | None]:
+    """
+    Assemble output text from a streaming Responses API reply.
+
+    Returns the text and, if the response stopped early, the reason.
+    """
+    chunks: list[str] = []
+    try:
+        for data in iter_sse_data(response):
+            if data == b"[DONE]":
+                break
+            event = parse_json_bytes(data)
+            event_type = event.get("type")
+            if event_type == "response.output_text.delta":
+                delta = str(event.get("delta") or "")
+                chunks.append(delta)
+                if on_text_delta is not None:
+                    on_text_delta(delta)
+            elif event_type in {"response.completed", "response.incomplete"}:
+                final = event.get("response") or {}
+                incomplete_reason = response_incomplete_reason(final)
+                if incomplete_reason is None and event_type == "response.incomplete":
+                    incomplete_reason = "unknown reason"
+                if not chunks:
+                    return parse_response_text(final), incomplete_reason
+                return "".join(chunks).strip(), incomplete_reason
+            elif event_type in {"error", "response.failed"}:
+                raise RuntimeError(f"Responses API stream failed: {data.decode('utf-8', 'ignore')}")
+    except OSError as exc:
+        if not chunks:
+            raise
+        # Text was already handed to the caller; a retry would repeat it.
+        raise RuntimeError(f"Responses API stream interrupted: {exc}") from exc
+    return "".join(chunks).strip(), None
+
+
+def retry_delay_seconds(attempt: int) -> float:
+    """Exponential backoff with jitter for the given zero-based retry attempt."""
+    delay = min(RETRY_MAX_DELAY_SECONDS, RETRY_INITIAL_DELAY_SECONDS * (2**attempt))
+    return delay + random.uniform(0, 1)
+
+
+def post_with_retries(
+    endpoint: str,
+    body: bytes,
+    headers: dict[str, str],
+    api_settings: ApiRequestSettings,
+    read_body: Callable[[requests.Response], Any] | None = None,
+) -> Any:
+    """
+    POST to the Responses API, retrying transient failures. Returns the response body.
+
+    A read timeout is not retried: the request was already sent and is likely
+    still being generated (and billed), so resending it would pay again.
+    """
+    attempt = 0
+    while True:
+        try:
+            status, raw = post_json_bytes(
+                endpoint,
+                body,
+                headers,
+                connect_timeout=api_settings.connect_timeout,
+                read_timeout=api_settings.read_timeout,
+                read_body=read_body,
+            )
+        except OSError as exc:  # requests.RequestException is an OSError.
+            if isinstance(exc, requests.exceptions.ReadTimeout):
+                raise RuntimeError(
+                    f"Responses API did not answer within {api_settings.read_timeout:g}s: {exc}"
+                ) from exc
+            if attempt >= api_settings.max_retries:
+                raise RuntimeError(f"Responses API request failed: {exc}") from exc
+        else:
+            if status < 400:
+                return raw
+            if status not in RETRYABLE_HTTP_STATUSES or attempt >= api_settings.max_retries:
+                error_body = raw.decode("utf-8", errors="ignore")
+                raise RuntimeError(f"Responses API HTTP {status}: {error_body}")
+        time.sleep(retry_delay_seconds(attempt))
+        attempt += 1
+
+
 def call_responses_api(
     *,
     endpoint: str,
@@ -238,15 +914,26 @@ def call_responses_api(
     user_text: str,
     image_data_url: str | None,
     image_data_urls: list[str] | None = None,
-) -> str:
+    api_settings: ApiRequestSettings = ApiRequestSettings(),
+    on_text_delta: Callable[[str], None] | None = None,
+) -> tuple[str, str | None]:
+    """
+    Ask the Responses API for an analysis of `user_text` plus images.
+
+    Returns the answer text and, when the model stopped early (status
+    "incomplete", e.g. at max_output_tokens), the reason; otherwise None.
+    """
+    image_urls = image_data_urls or ([image_data_url] if image_data_url else [])
+    # Images are serialized as short placeholders and spliced into the encoded
+    # body afterwards, so multi-megabyte data URLs skip the JSON encoder.
+    nonce = os.urandom(8).hex()
+    placeholders = [f"whistleblower-image-{nonce}-{index}" for index in range(len(image_urls))]
     content: list[dict[str, Any]] = [{"type": "input_text", "text": user_text}]
-    if image_data_urls:
-        content.extend([{"type": "input_image", "image_url": url} for url in image_data_urls])
-    elif image_data_url:
-        content.append({"type": "input_image", "image_url": image_data_url})
+    content.extend({"type": "input_image", "image_url": placeholder} for placeholder in placeholders)
 
     request_payload = {
         "model": model,
+        "max_output_tokens": api_settings.max_output_tokens,
         "input": [
             {
                 "role": "system",
@@ -258,29 +945,58 @@ def call_responses_api(
             },
         ],
     }
-    body = json.dumps(request_payload).encode("utf-8")
-    req = urllib.request.Request(
-        endpoint,
-        data=body,
-        method="POST",
-        headers={
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json",
-        },
-    )
-    try:
-        with urllib.request.urlopen(req, timeout=120) as resp:
-            response_payload = json.loads(resp.read().decode("utf-8"))
-    except urllib.error.HTTPError as exc:
-        error_body = exc.read().decode("utf-8", errors="ignore")
-        raise RuntimeError(f"Responses API HTTP {exc.code}: {error_body}") from exc
-    except urllib.error.URLError as exc:
-        raise RuntimeError(f"Responses API request failed: {exc}") from exc
-
-    text = parse_response_text(response_payload)
+    # Identical requests (same endpoint, model, prompts, and images) reuse the
+    # earlier completed answer instead of paying for another model call.
+    # Streaming only changes the transport, so it is left out of the key.
+    body = splice_json_strings(dump_json_bytes(request_payload), placeholders, image_urls)
+    cache_path: Path | None = None
+    if api_settings.response_cache_dir is not None:
+        digest = hashlib.sha256(endpoint.encode("utf-8") + b"\n" + body).hexdigest()
+        cache_path = api_settings.response_cache_dir / f"{digest}.txt"
+    if cache_path is not None and not api_settings.refresh_response_cache:
+        try:
+            with cache_path.open(encoding="utf-8") as handle:
+                ttl = api_settings.response_cache_ttl
+                if ttl is None or time.time() - os.fstat(handle.fileno()).st_mtime <= ttl:
+                    return handle.read(), None
+        except OSError:
+            pass
+
+    if api_settings.stream:
+        request_payload["stream"] = True
+        body = splice_json_strings(dump_json_bytes(request_payload), placeholders, image_urls)
+
+    headers = {
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json",
+    }
+    if api_settings.stream:
+        text, incomplete_reason = post_with_retries(
+            endpoint,
+            body,
+            headers,
+            api_settings,
+            read_body=lambda response: read_streamed_text(response, on_text_delta),
+        )
+    else:
+        payload = parse_json_bytes(post_with_retries(endpoint, body, headers, api_settings))
+        text = parse_response_text(payload)
+        incomplete_reason = response_incomplete_reason(payload)
     if not text:
         raise RuntimeError("Responses API returned no text output.")
-    return text
+    if incomplete_reason is not None:
+        print(
+            f"WARNING: Responses API answer is incomplete ({incomplete_reason}); "
+            "it is kept but not treated as a final analysis.",
+            file=sys.stderr,
+        )
+    if cache_path is not None and incomplete_reason is None:
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            write_text_atomic(cache_path, text)
+        except OSError as exc:
+            print(f"WARNING: Could not write response cache {cache_path}: {exc}", file=sys.stderr)
+    return text, incomplete_reason
 
 
 def default_system_prompt() -> str:
@@ -290,10 +1006,9 @@ def default_system_prompt() -> str:
     )
 
 
-def default_user_prompt(meta: dict[str, Any], dom: dict[str, Any], max_dom_chars: int) -> str:
-    dom_text = str(dom.get("text") or "")
-    dom_excerpt = dom_text[:max_dom_chars]
-    lines = [
+# Built once at import; only the per-capture fields are filled in per target.
+USER_PROMPT_TEMPLATE = "\n".join(
+    [
         "Analyze this dashboard capture for operational insight and anomalies.",
         "Return markdown with these sections:",
         "1. Summary (2-4 bullets, operator-facing, plain language)",
@@ -303,25 +1018,35 @@ def default_user_prompt(meta: dict[str, Any], dom: dict[str, Any], max_dom_chars
         "5. Suggested checks",
         "",
         "Capture metadata:",
-        f"- target_name: {meta.get('target_name', '')}",
-        f"- target_url: {meta.get('target_url', '')}",
-        f"- title: {meta.get('title', '')}",
-        f"- url_after_navigation: {meta.get('url_after_navigation', '')}",
-        f"- readiness_error: {meta.get('readiness_error', '')}",
+        "- target_name: {target_name}",
+        "- target_url: {target_url}",
+        "- title: {title}",
+        "- url_after_navigation: {url_after_navigation}",
+        "- readiness_error: {readiness_error}",
         "",
-        f"DOM text excerpt (first {len(dom_excerpt)} chars):",
-        dom_excerpt if dom_excerpt else "(no DOM text)",
+        "DOM text excerpt (first {excerpt_chars} chars):",
+        "{dom_excerpt}",
     ]
-    return "\n".join(lines)
+)
 
 
-def default_combined_prompt(
-    run_dir: Path,
-    metas: list[dict[str, Any]],
-    doms: list[dict[str, Any]],
-    max_dom_chars: int,
-) -> str:
-    lines = [
+def default_user_prompt(meta: dict[str, Any], dom: dict[str, Any], max_dom_chars: int) -> str:
+    dom_text = str(dom.get("text") or "")
+    dom_excerpt = dom_text[:max_dom_chars]
+    return USER_PROMPT_TEMPLATE.format(
+        target_name=meta.get("target_name", ""),
+        target_url=meta.get("target_url", ""),
+        title=meta.get("title", ""),
+        url_after_navigation=meta.get("url_after_navigation", ""),
+        readiness_error=meta.get("readiness_error", ""),
+        excerpt_chars=len(dom_excerpt),
+        dom_excerpt=dom_excerpt if dom_excerpt else "(no DOM text)",
+    )
+
+
+# Combined prompts are a fixed header followed by one filled-in block per page.
+COMBINED_PROMPT_HEADER_TEMPLATE = "\n".join(
+    [
         "Analyze this set of dashboard captures for operational insight and anomalies.",
         "Return markdown with these sections:",
         "1. Summary (3-6 bullets, operator-facing, plain language)",
@@ -330,26 +1055,143 @@ def default_combined_prompt(
         "4. Evidence",
         "5. Suggested checks",
         "",
-        f"Run directory: {run_dir}",
+        "Run directory: {run_dir}",
         "",
     ]
+)
+COMBINED_PAGE_TEMPLATE = "\n".join(
+    [
+        "Page {page_number}:",
+        "- target_name: {target_name}",
+        "- target_url: {target_url}",
+        "- title: {title}",
+        "- url_after_navigation: {url_after_navigation}",
+        "- readiness_error: {readiness_error}",
+        "- DOM text excerpt (first {excerpt_chars} chars):",
+        "{dom_excerpt}",
+        "",
+    ]
+)
+
+
+def default_combined_prompt(
+    run_dir: Path,
+    metas: list[dict[str, Any]],
+    doms: list[dict[str, Any]],
+    max_dom_chars: int,
+) -> str:
+    parts = [COMBINED_PROMPT_HEADER_TEMPLATE.format(run_dir=run_dir)]
     for index, meta in enumerate(metas):
-        dom_text = str(doms[index].get("text") or "")
-        dom_excerpt = dom_text[:max_dom_chars]
-        lines.extend(
-            [
-                f"Page {index + 1}:",
-                f"- target_name: {meta.get('target_name', '')}",
-                f"- target_url: {meta.get('target_url', '')}",
-                f"- title: {meta.get('title', '')}",
-                f"- url_after_navigation: {meta.get('url_after_navigation', '')}",
-                f"- readiness_error: {meta.get('readiness_error', '')}",
-                f"- DOM text excerpt (first {len(dom_excerpt)} chars):",
-                dom_excerpt if dom_excerpt else "(no DOM text)",
-                "",
-            ]
+        dom_excerpt = str(doms[index].get("text") or "")[:max_dom_chars]
+        parts.append(
+            COMBINED_PAGE_TEMPLATE.format(
+                page_number=index + 1,
+                target_name=meta.get("target_name", ""),
+                target_url=meta.get("target_url", ""),
+                title=meta.get("title", ""),
+                url_after_navigation=meta.get("url_after_navigation", ""),
+                readiness_error=meta.get("readiness_error", ""),
+                excerpt_chars=len(dom_excerpt),
+                dom_excerpt=dom_excerpt if dom_excerpt else "(no DOM text)",
+            )
         )
-    return "\n".join(lines)
+    return "\n".join(parts)
+
+
+def unavailable_capture_analysis(
+    meta: dict[str, Any], dom_text: str, require_dom_chars: int
+) -> str | None:
+    """Canned analysis for a capture that failed readiness and has almost no DOM text."""
+    readiness_error = meta.get("readiness_error")
+    if not readiness_error or len(dom_text.strip()) >= require_dom_chars:
+        return None
+    return "\n".join(
+        [
+            "## Summary",
+            f"- Capture unavailable: {readiness_error}",
+            "- The page did not render enough content to analyze, so no model call was made.",
+        ]
+    )
+
+
+TARGET_INPUT_FILES = ("screenshot.png", "dom.json", "meta.json")
+
+
+def newest_target_input_ns(target_dir: Path) -> int:
+    """
+    Newest mtime (ns) of a target's capture files, statting each file once.
+
+    Raises ValueError if any of them is missing.
+    """
+    try:
+        return max((target_dir / name).stat().st_mtime_ns for name in TARGET_INPUT_FILES)
+    except FileNotFoundError:
+        raise ValueError(f"Missing required files in {target_dir}") from None
+
+
+def analysis_settings_digest(
+    custom_prompt: str | None,
+    max_dom_chars: int,
+    max_image_dim: int | None,
+    require_dom_chars: int,
+) -> str:
+    """
+    SHA-256 of everything besides the capture and model that shapes a per-page analysis.
+
+    Covers the system prompt, the user prompt (the custom prompt, or the
+    default template the capture is filled into), and the size limits.
+    """
+    downscale = max_image_dim if max_image_dim and Image is not None else 0
+    settings = [
+        default_system_prompt(),
+        custom_prompt or USER_PROMPT_TEMPLATE,
+        max_dom_chars,
+        downscale,
+        require_dom_chars,
+    ]
+    return hashlib.sha256(dump_json_bytes(settings)).hexdigest()
+
+
+def existing_target_analysis(
+    target_dir: Path, model: str, settings_digest: str, newest_input_ns: int
+) -> dict[str, Any] | None:
+    """
+    Return the prior result for `target_dir` if it is newer than its inputs.
+
+    It must also have been produced by `model` with the same settings_digest.
+    """
+    analysis_md = target_dir / "analysis.md"
+    analysis_json = target_dir / "analysis.json"
+    try:
+        if not analysis_md.exists():
+            return None
+        if analysis_json.stat().st_mtime_ns < newest_input_ns:
+            return None
+        previous = load_json_file(analysis_json)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(previous, dict) or previous.get("model") != model:
+        return None
+    if previous.get("settings_sha256") != settings_digest:
+        return None
+    if previous.get("incomplete_reason") is not None:
+        return None
+    return {
+        "target_dir": str(target_dir),
+        "target_name": previous.get("target_name", target_dir.name),
+        "analysis_md": str(analysis_md),
+        "analysis_json": str(analysis_json),
+        "reused_existing": True,
+    }
+
+
+def target_needs_analysis(target_dir: Path, model: str, settings_digest: str) -> bool:
+    """True if `target_dir` has all its capture files and no up-to-date analysis from `model`."""
+    try:
+        newest_input_ns = newest_target_input_ns(target_dir)
+    except ValueError:
+        return False
+    return existing_target_analysis(target_dir, model, settings_digest, newest_input_ns) is None
 
 
 def analyze_target(
@@ -360,41 +1202,83 @@ def analyze_target(
     model: str,
     max_dom_chars: int,
     custom_prompt: str | None,
+    api_settings: ApiRequestSettings = ApiRequestSettings(),
+    force: bool = False,
+    max_image_dim: int | None = DEFAULT_MAX_IMAGE_DIM,
+    require_dom_chars: int = DEFAULT_REQUIRE_DOM_CHARS,
 ) -> dict[str, Any]:
     screenshot_path = target_dir / "screenshot.png"
     dom_path = target_dir / "dom.json"
     meta_path = target_dir / "meta.json"
-    if not screenshot_path.exists() or not dom_path.exists() or not meta_path.exists():
-        raise ValueError(f"Missing required files in {target_dir}")
-
-    dom = json.loads(dom_path.read_text(encoding="utf-8"))
-    meta = json.loads(meta_path.read_text(encoding="utf-8"))
-    user_prompt = custom_prompt or default_user_prompt(meta, dom, max_dom_chars)
-    analysis_text = call_responses_api(
-        endpoint=endpoint,
-        api_key=api_key,
-        model=model,
-        system_prompt=default_system_prompt(),
-        user_text=user_prompt,
-        image_data_url=b64_data_url(screenshot_path),
+    settings_digest = analysis_settings_digest(
+        custom_prompt, max_dom_chars, max_image_dim, require_dom_chars
     )
+    newest_input_ns = newest_target_input_ns(target_dir)
+    if not force:
+        existing = existing_target_analysis(target_dir, model, settings_digest, newest_input_ns)
+        if existing is not None:
+            return existing
+
+    dom = {"text": read_dom_text_excerpt(dom_path, max_dom_chars)}
+    meta = load_json_file(meta_path)
+    unavailable = unavailable_capture_analysis(meta, dom["text"], require_dom_chars)
+    if unavailable is not None:
+        return write_target_analysis(target_dir, meta, model, settings_digest, unavailable)
+    user_prompt = custom_prompt or default_user_prompt(meta, dom, max_dom_chars)
+    # With --stream, text lands in a temp file beside analysis.md as it arrives.
+    with StreamedTextFile(target_dir / "analysis.md") as streamed:
+        analysis_text, incomplete_reason = call_responses_api(
+            endpoint=endpoint,
+            api_key=api_key,
+            model=model,
+            system_prompt=default_system_prompt(),
+            user_text=user_prompt,
+            image_data_url=cached_b64_data_url(screenshot_path, max_image_dim),
+            api_settings=api_settings,
+            on_text_delta=streamed.write if api_settings.stream else None,
+        )
+        return write_target_analysis(
+            target_dir, meta, model, settings_digest, analysis_text, streamed, incomplete_reason
+        )
 
+
+def write_target_analysis(
+    target_dir: Path,
+    meta: dict[str, Any],
+    model: str,
+    settings_digest: str,
+    analysis_text: str,
+    streamed: StreamedTextFile | None = None,
+    incomplete_reason: str | None = None,
+) -> dict[str, Any]:
+    """
+    Write analysis.md and analysis.json for one target.
+
+    An incomplete answer is written with a visible note and recorded in
+    analysis.json, so the next run analyzes the target again.
+    """
     analysis_md = target_dir / "analysis.md"
     analysis_json = target_dir / "analysis.json"
-    analysis_md.write_text(analysis_text + "\n", encoding="utf-8")
-    analysis_json.write_text(
-        json.dumps(
+    analysis_text = mark_incomplete(analysis_text, incomplete_reason)
+    if streamed is not None:
+        streamed.commit(analysis_text + "\n")
+    else:
+        write_text_atomic(analysis_md, analysis_text + "\n")
+    write_bytes_atomic(
+        analysis_json,
+        dump_json_bytes(
             {
                 "analyzed_at_utc": utc_now_iso(),
                 "model": model,
+                "settings_sha256": settings_digest,
                 "target_dir": str(target_dir),
                 "target_name": meta.get("target_name", target_dir.name),
                 "target_url": meta.get("target_url", ""),
                 "analysis_md": analysis_md.name,
+                "incomplete_reason": incomplete_reason,
             },
-            indent=2,
+            indent=True,
         ),
-        encoding="utf-8",
     )
 
     return {
@@ -402,7 +1286,151 @@ def analyze_target(
         "target_name": meta.get("target_name", target_dir.name),
         "analysis_md": str(analysis_md),
         "analysis_json": str(analysis_json),
+        "incomplete_reason": incomplete_reason,
+    }
+
+
+def batch_user_prompt(prompts: list[str]) -> str:
+    lines = [
+        f"You are given {len(prompts)} separate dashboard captures. "
+        "The images are attached in the same order as the captures below.",
+        f"Analyze each capture independently and return ONLY a JSON array of {len(prompts)} strings.",
+        "Element i must be the complete markdown analysis of capture i, following that capture's "
+        "instructions. Do not wrap the array in any other text.",
+        "",
+    ]
+    for index, prompt in enumerate(prompts, start=1):
+        lines.extend([f"=== Capture {index} ===", prompt, ""])
+    return "\n".join(lines)
+
+
+def split_batch_response(text: str, expected: int) -> list[str] | None:
+    """Parse a batched answer into `expected` markdown analyses, or None if malformed."""
+    candidate = text.strip()
+    if candidate.startswith("```"):
+        candidate = candidate.partition("\n")[2].rsplit("```", 1)[0]
+    try:
+        parsed = json.loads(candidate)
+    except ValueError:
+        return None
+    if not isinstance(parsed, list) or len(parsed) != expected:
+        return None
+    if not all(isinstance(item, str) and item.strip() for item in parsed):
+        return None
+    return [item.strip() for item in parsed]
+
+
+def analyze_target_batch(
+    *,
+    target_dirs: list[Path],
+    endpoint: str,
+    api_key: str,
+    model: str,
+    max_dom_chars: int,
+    custom_prompt: str | None,
+    api_settings: ApiRequestSettings = ApiRequestSettings(),
+    force: bool = False,
+    max_image_dim: int | None = DEFAULT_MAX_IMAGE_DIM,
+    require_dom_chars: int = DEFAULT_REQUIRE_DOM_CHARS,
+) -> list[dict[str, Any]]:
+    """
+    Analyze several targets with a single Responses API call.
+
+    Each target still gets its own analysis.md/analysis.json. If the model's
+    answer cannot be split back into one analysis per target, the batch falls
+    back to one call per target.
+    """
+    request_kwargs: dict[str, Any] = {
+        "endpoint": endpoint,
+        "api_key": api_key,
+        "model": model,
+        "max_dom_chars": max_dom_chars,
+        "custom_prompt": custom_prompt,
+        "api_settings": api_settings,
+        "max_image_dim": max_image_dim,
+        "require_dom_chars": require_dom_chars,
     }
+    if len(target_dirs) == 1:
+        return [analyze_target(target_dir=target_dirs[0], force=force, **request_kwargs)]
+
+    settings_digest = analysis_settings_digest(
+        custom_prompt, max_dom_chars, max_image_dim, require_dom_chars
+    )
+    results: list[dict[str, Any] | None] = [None] * len(target_dirs)
+    pending: list[tuple[int, Path, dict[str, Any]]] = []
+    prompts: list[str] = []
+    images: list[str] = []
+    for index, target_dir in enumerate(target_dirs):
+        screenshot_path = target_dir / "screenshot.png"
+        dom_path = target_dir / "dom.json"
+        meta_path = target_dir / "meta.json"
+        newest_input_ns = newest_target_input_ns(target_dir)
+        if not force:
+            existing = existing_target_analysis(target_dir, model, settings_digest, newest_input_ns)
+            if existing is not None:
+                results[index] = existing
+                continue
+        dom = {"text": read_dom_text_excerpt(dom_path, max_dom_chars)}
+        meta = load_json_file(meta_path)
+        unavailable = unavailable_capture_analysis(meta, dom["text"], require_dom_chars)
+        if unavailable is not None:
+            results[index] = write_target_analysis(
+                target_dir, meta, model, settings_digest, unavailable
+            )
+            continue
+        pending.append((index, target_dir, meta))
+        prompts.append(custom_prompt or default_user_prompt(meta, dom, max_dom_chars))
+        images.append(cached_b64_data_url(screenshot_path, max_image_dim))
+
+    if len(pending) > 1:
+        batch_text, incomplete_reason = call_responses_api(
+            endpoint=endpoint,
+            api_key=api_key,
+            model=model,
+            system_prompt=default_system_prompt(),
+            user_text=batch_user_prompt(prompts),
+            image_data_url=None,
+            image_data_urls=images,
+            api_settings=replace(
+                api_settings, max_output_tokens=api_settings.max_output_tokens * len(pending)
+            ),
+        )
+        # A cut-off batch is retried page by page rather than split.
+        analyses = (
+            split_batch_response(batch_text, len(pending)) if incomplete_reason is None else None
+        )
+        if analyses is not None:
+            for (index, target_dir, meta), analysis_text in zip(pending, analyses):
+                results[index] = write_target_analysis(
+                    target_dir, meta, model, settings_digest, analysis_text
+                )
+            pending = []
+        else:
+            print(
+                f"WARNING: Could not split batched analysis of {len(pending)} targets; "
+                "retrying them one at a time.",
+                file=sys.stderr,
+            )
+
+    for index, target_dir, _ in pending:
+        results[index] = analyze_target(target_dir=target_dir, force=True, **request_kwargs)
+    return [result for result in results if result is not None]
+
+
+def load_combined_target(
+    target_dir: Path, max_dom_chars: int, max_image_dim: int | None
+) -> tuple[dict[str, Any], dict[str, Any], str] | None:
+    """Load (meta, DOM excerpt, screenshot data URL) for one target, or None if files are missing."""
+    # discover_target_dirs already saw screenshot.png and dom.json; a missing
+    # meta.json surfaces here on open instead of through extra exists() checks.
+    try:
+        return (
+            load_json_file(target_dir / "meta.json"),
+            {"text": read_dom_text_excerpt(target_dir / "dom.json", max_dom_chars)},
+            cached_b64_data_url(target_dir / "screenshot.png", max_image_dim),
+        )
+    except FileNotFoundError:
+        return None
 
 
 def analyze_run_combined(
@@ -413,88 +1441,105 @@ def analyze_run_combined(
     model: str,
     max_dom_chars: int,
     custom_prompt: str | None,
+    api_settings: ApiRequestSettings = ApiRequestSettings(),
+    max_image_dim: int | None = DEFAULT_MAX_IMAGE_DIM,
+    cpu_workers: int = 0,
 ) -> dict[str, Any]:
     target_dirs = discover_target_dirs(run_dir)
     if not target_dirs:
         raise ValueError(f"No target capture directories found in: {run_dir}")
+    warm_screenshot_caches(
+        [target_dir / "screenshot.png" for target_dir in target_dirs], max_image_dim, cpu_workers
+    )
 
     metas: list[dict[str, Any]] = []
     doms: list[dict[str, Any]] = []
     images: list[str] = []
 
-    for target_dir in target_dirs:
-        screenshot_path = target_dir / "screenshot.png"
-        dom_path = target_dir / "dom.json"
-        meta_path = target_dir / "meta.json"
-        if not screenshot_path.exists() or not dom_path.exists() or not meta_path.exists():
+    # Reading and encoding each target is independent; overlap them and keep target order.
+    with ThreadPoolExecutor(max_workers=min(DEFAULT_CONCURRENCY, len(target_dirs))) as executor:
+        loaded = list(
+            executor.map(
+                lambda target_dir: load_combined_target(target_dir, max_dom_chars, max_image_dim),
+                target_dirs,
+            )
+        )
+    for target in loaded:
+        if target is None:
             continue
-        doms.append(json.loads(dom_path.read_text(encoding="utf-8")))
-        metas.append(json.loads(meta_path.read_text(encoding="utf-8")))
-        images.append(b64_data_url(screenshot_path))
+        meta, dom, image = target
+        metas.append(meta)
+        doms.append(dom)
+        images.append(image)
 
     if not metas:
         raise ValueError(f"No analyzable targets found in: {run_dir}")
 
     user_prompt = custom_prompt or default_combined_prompt(run_dir, metas, doms, max_dom_chars)
-    analysis_text = call_responses_api(
-        endpoint=endpoint,
-        api_key=api_key,
-        model=model,
-        system_prompt=default_system_prompt(),
-        user_text=user_prompt,
-        image_data_url=None,
-        image_data_urls=images,
-    )
-
     combined_md = run_dir / "analysis_combined.md"
     combined_json = run_dir / "analysis_combined.json"
-    combined_md.write_text(analysis_text + "\n", encoding="utf-8")
-    combined_json.write_text(
-        json.dumps(
+    with StreamedTextFile(combined_md) as streamed:
+        analysis_text, incomplete_reason = call_responses_api(
+            endpoint=endpoint,
+            api_key=api_key,
+            model=model,
+            system_prompt=default_system_prompt(),
+            user_text=user_prompt,
+            image_data_url=None,
+            image_data_urls=images,
+            # One answer covers every page, so the cap scales as in batch mode.
+            api_settings=replace(
+                api_settings, max_output_tokens=api_settings.max_output_tokens * len(metas)
+            ),
+            on_text_delta=streamed.write if api_settings.stream else None,
+        )
+        streamed.commit(mark_incomplete(analysis_text, incomplete_reason) + "\n")
+    write_bytes_atomic(
+        combined_json,
+        dump_json_bytes(
             {
                 "analyzed_at_utc": utc_now_iso(),
                 "model": model,
                 "run_dir": str(run_dir),
                 "pages_analyzed": len(metas),
                 "analysis_md": combined_md.name,
+                "incomplete_reason": incomplete_reason,
             },
-            indent=2,
+            indent=True,
         ),
-        encoding="utf-8",
     )
     return {
         "run_dir": str(run_dir),
         "analysis_md": str(combined_md),
         "analysis_json": str(combined_json),
+        "incomplete_reason": incomplete_reason,
     }
 
 
 def discover_target_dirs(run_dir: Path) -> list[Path]:
-    return sorted(
-        [
-            p
-            for p in run_dir.iterdir()
-            if p.is_dir() and (p / "screenshot.png").exists() and (p / "dom.json").exists()
-        ]
-    )
+    required = {"screenshot.png", "dom.json"}
+    target_dirs: list[Path] = []
+    for name in sorted(subdir_names(run_dir)):
+        target_dir = run_dir / name
+        with os.scandir(target_dir) as entries:
+            if required.issubset(entry.name for entry in entries):
+                target_dirs.append(target_dir)
+    return target_dirs
+
+
+# One `KEY=value` assignment per line, optionally prefixed with `export`.
+# Blank lines and `#` comments never match.
+ENV_LINE_RE = re.compile(
+    r"^[ \t]*(?:export[ \t]+)?([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*(.*?)[ \t]*$",
+    re.MULTILINE,
+)
 
 
 def load_env_file(path: Path) -> None:
     if not path.exists():
         return
-    for raw_line in path.read_text(encoding="utf-8").splitlines():
-        line = raw_line.strip()
-        if not line or line.startswith("#"):
-            continue
-        if line.startswith("export "):
-            line = line[len("export ") :].strip()
-        if "=" not in line:
-            continue
-        key, value = line.split("=", 1)
-        key = key.strip()
-        value = value.strip().strip('"').strip("'")
-        if key:
-            os.environ.setdefault(key, value)
+    for match in ENV_LINE_RE.finditer(path.read_text(encoding="utf-8")):
+        os.environ.setdefault(match.group(1), match.group(2).strip('"').strip("'"))
 
 
 def run_analysis(
@@ -512,6 +1557,19 @@ def run_analysis(
     custom_prompt: str | None = None,
     combine_run: bool = True,
     env_file: str = ".env",
+    concurrency: int = DEFAULT_CONCURRENCY,
+    max_output_tokens: int = DEFAULT_MAX_OUTPUT_TOKENS,
+    connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+    read_timeout: float = DEFAULT_READ_TIMEOUT,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    force: bool = False,
+    response_cache: bool = False,
+    max_image_dim: int | None = DEFAULT_MAX_IMAGE_DIM,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    require_dom_chars: int = DEFAULT_REQUIRE_DOM_CHARS,
+    stream: bool = False,
+    cpu_workers: int = 0,
+    response_cache_ttl_hours: float | None = None,
 ) -> dict[str, Any]:
     """
     Run analysis on capture artifacts using an LLM.
@@ -531,6 +1589,22 @@ def run_analysis(
         custom_prompt: Custom analysis prompt
         combine_run: Combine all targets into single analysis
         env_file: Path to .env file
+        concurrency: Max concurrent Responses API requests in per-page mode
+        max_output_tokens: Upper bound on tokens generated per page (scaled by page count when combined)
+        connect_timeout: Seconds to wait when connecting to the API
+        read_timeout: Seconds to wait for API response data
+        max_retries: Retries for transient API failures
+        force: Re-analyze per-page targets that already have an up-to-date analysis, and
+            call the API instead of reading the response cache (fresh answers still
+            overwrite the cache entries when response_cache is on)
+        response_cache: Read and store completed answers to byte-identical API requests
+            in the response cache (off by default; the CLI turns it on)
+        max_image_dim: Downscale screenshots larger than this (pixels, 0/None disables)
+        batch_size: Pages sent per Responses API request in per-page mode
+        require_dom_chars: Skip the model for failed captures with less DOM text than this
+        stream: Request streaming responses from the API
+        cpu_workers: Worker processes for pre-encoding screenshots (0 encodes in the analysis threads)
+        response_cache_ttl_hours: Ignore cached answers older than this (None never expires them)
     
     Returns:
         Dictionary with analysis summary and results
@@ -555,6 +1629,35 @@ def run_analysis(
             if not api_key:
                 raise ValueError(f"API key not found. Set {api_key_env_name} environment variable.")
 
+    if concurrency < 1:
+        raise ValueError("concurrency must be >= 1")
+    if batch_size < 1:
+        raise ValueError("batch_size must be >= 1")
+    if max_output_tokens < 1:
+        raise ValueError("max_output_tokens must be >= 1")
+    if connect_timeout <= 0 or read_timeout <= 0:
+        raise ValueError("connect_timeout and read_timeout must be > 0")
+    if max_retries < 0:
+        raise ValueError("max_retries must be >= 0")
+    if cpu_workers < 0:
+        raise ValueError("cpu_workers must be >= 0")
+    if response_cache_ttl_hours is not None and response_cache_ttl_hours < 0:
+        raise ValueError("response_cache_ttl_hours must be >= 0")
+    if max_image_dim is not None and max_image_dim < 0:
+        raise ValueError("max_image_dim must be >= 0")
+    api_settings = ApiRequestSettings(
+        max_output_tokens=max_output_tokens,
+        connect_timeout=connect_timeout,
+        read_timeout=read_timeout,
+        max_retries=max_retries,
+        response_cache_dir=default_response_cache_dir() if response_cache else None,
+        refresh_response_cache=force,
+        response_cache_ttl=(
+            response_cache_ttl_hours * 3600 if response_cache_ttl_hours is not None else None
+        ),
+        stream=stream,
+    )
+
     start_dt = parse_iso_utc(start_utc)
     end_dt = parse_iso_utc(end_utc)
     if start_utc and start_dt is None:
@@ -575,7 +1678,38 @@ def run_analysis(
 
     all_run_summaries = []
     skipped_runs = []
-    
+
+    # Combined mode makes one request per run, so a time range fans out across
+    # runs instead; results are still consumed in run order below.
+    combined_futures: dict[Path, Any] = {}
+    run_executor: ThreadPoolExecutor | None = None
+    existing_run_dirs = [path for path in run_dirs if path.exists()]
+    if combine_run and len(existing_run_dirs) > 1:
+        warm_screenshot_caches(
+            [
+                target_dir / "screenshot.png"
+                for path in existing_run_dirs
+                for target_dir in discover_target_dirs(path)
+            ],
+            max_image_dim,
+            cpu_workers,
+        )
+        run_executor = ThreadPoolExecutor(max_workers=min(concurrency, len(existing_run_dirs)))
+        combined_futures = {
+            path: run_executor.submit(
+                analyze_run_combined,
+                run_dir=path,
+                endpoint=endpoint,
+                api_key=api_key,
+                model=model,
+                max_dom_chars=max_dom_chars,
+                custom_prompt=custom_prompt,
+                api_settings=api_settings,
+                max_image_dim=max_image_dim,
+            )
+            for path in existing_run_dirs
+        }
+
     for run_dir_path in run_dirs:
         try:
             if not run_dir_path.exists():
@@ -584,14 +1718,20 @@ def run_analysis(
                 continue
 
             if combine_run:
-                combined = analyze_run_combined(
-                    run_dir=run_dir_path,
-                    endpoint=endpoint,
-                    api_key=api_key,
+                if run_dir_path in combined_futures:
+                    combined = combined_futures[run_dir_path].result()
+                else:
+                    combined = analyze_run_combined(
+                        run_dir=run_dir_path,
+                        endpoint=endpoint,
+                        api_key=api_key,
                         model=model,
-                    max_dom_chars=max_dom_chars,
-                    custom_prompt=custom_prompt,
-                )
+                        max_dom_chars=max_dom_chars,
+                        custom_prompt=custom_prompt,
+                        api_settings=api_settings,
+                        max_image_dim=max_image_dim,
+                        cpu_workers=cpu_workers,
+                    )
                 run_summary = {
                     "analyzed_at_utc": utc_now_iso(),
                     "run_dir": str(run_dir_path),
@@ -608,17 +1748,42 @@ def run_analysis(
                     skipped_runs.append(str(run_dir_path))
                     continue
 
-                results = []
-                for target_dir in target_dirs:
-                    result = analyze_target(
-                        target_dir=target_dir,
-                        endpoint=endpoint,
-                        api_key=api_key,
-                        model=model,
-                        max_dom_chars=max_dom_chars,
-                        custom_prompt=custom_prompt,
-                    )
-                    results.append(result)
+                settings_digest = analysis_settings_digest(
+                    custom_prompt, max_dom_chars, max_image_dim, require_dom_chars
+                )
+                warm_screenshot_caches(
+                    [
+                        target_dir / "screenshot.png"
+                        for target_dir in target_dirs
+                        if force or target_needs_analysis(target_dir, model, settings_digest)
+                    ],
+                    max_image_dim,
+                    cpu_workers,
+                )
+                # Each batch is an independent, network-bound request; fan them out
+                # and collect results in target order.
+                batches = [
+                    target_dirs[start : start + batch_size]
+                    for start in range(0, len(target_dirs), batch_size)
+                ]
+                with ThreadPoolExecutor(max_workers=min(concurrency, len(batches))) as executor:
+                    futures = [
+                        executor.submit(
+                            analyze_target_batch,
+                            target_dirs=batch,
+                            endpoint=endpoint,
+                            api_key=api_key,
+                            model=model,
+                            max_dom_chars=max_dom_chars,
+                            custom_prompt=custom_prompt,
+                            api_settings=api_settings,
+                            force=force,
+                            max_image_dim=max_image_dim,
+                            require_dom_chars=require_dom_chars,
+                        )
+                        for batch in batches
+                    ]
+                    results = [result for future in futures for result in future.result()]
 
                 run_summary = {
                     "analyzed_at_utc": utc_now_iso(),
@@ -631,14 +1796,17 @@ def run_analysis(
                 }
 
             run_analysis_path = run_dir_path / "analysis_summary.json"
-            run_analysis_path.write_text(json.dumps(run_summary, indent=2), encoding="utf-8")
+            write_bytes_atomic(run_analysis_path, dump_json_bytes(run_summary, indent=True))
             all_run_summaries.append(run_summary)
         
         except Exception as run_exc:
             print(f"WARNING: Error analyzing run {run_dir_path}, skipping: {run_exc}", file=sys.stderr)
             skipped_runs.append(str(run_dir_path))
             continue
-    
+
+    if run_executor is not None:
+        run_executor.shutdown()
+
     # If no runs were successfully analyzed, raise an error
     if not all_run_summaries:
         if skipped_runs:
@@ -651,8 +1819,9 @@ def run_analysis(
         if site:
             range_root = range_root / site
         range_summary_path = range_root / "analysis_range_summary.json"
-        range_summary_path.write_text(
-            json.dumps(
+        write_bytes_atomic(
+            range_summary_path,
+            dump_json_bytes(
                 {
                     "analyzed_at_utc": utc_now_iso(),
                     "provider": provider,
@@ -663,9 +1832,8 @@ def run_analysis(
                     "runs_analyzed": len(all_run_summaries),
                     "runs": all_run_summaries,
                 },
-                indent=2,
-            ),
-            encoding="utf-8",
+                indent=True,
+            )
         )
     
     result = {
@@ -705,6 +1873,19 @@ def main() -> int:
             custom_prompt=args.prompt,
             combine_run=args.combine_run or not args.per_page,
             env_file=args.env_file,
+            concurrency=args.concurrency,
+            max_output_tokens=args.max_output_tokens,
+            connect_timeout=args.connect_timeout,
+            read_timeout=args.read_timeout,
+            max_retries=args.max_retries,
+            force=args.force,
+            response_cache=not args.no_response_cache,
+            max_image_dim=args.max_image_dim,
+            batch_size=args.batch_size,
+            require_dom_chars=args.require_dom_chars,
+            stream=args.stream,
+            cpu_workers=args.cpu_workers,
+            response_cache_ttl_hours=args.response_cache_ttl,
         )
         print(result["message"])
         return 0
@@ -9,21 +9,29 @@ This script generates icons for macOS (.icns) and Windows (.ico).
 import importlib
 from typing import Any
 
-try:
-    Image: Any = importlib.import_module("PIL.Image")
-    ImageDraw: Any = importlib.import_module("PIL.ImageDraw")
-    ImageFont: Any = importlib.import_module("PIL.ImageFont")
-    HAS_PIL = True
-except ModuleNotFoundError:
-    HAS_PIL = False
-    Image = None
-    ImageDraw = None
-    ImageFont = None
-    print("Note: Install Pillow for icon generation: pip install Pillow")
+# Pillow is imported on first use so that importing this module stays cheap.
+Image: Any = None
+ImageDraw: Any = None
+ImageFont: Any = None
+HAS_PIL: bool | None = None
+
+def load_pil():
+    """Import Pillow on first call; return whether it is available."""
+    global Image, ImageDraw, ImageFont, HAS_PIL
+    if HAS_PIL is None:
+        try:
+            Image = importlib.import_module("PIL.Image")
+            ImageDraw = importlib.import_module("PIL.ImageDraw")
+            ImageFont = importlib.import_module("PIL.ImageFont")
+            HAS_PIL = True
+        except ModuleNotFoundError:
+            HAS_PIL = False
+            print("Note: Install Pillow for icon generation: pip install Pillow")
+    return HAS_PIL
 
 def create_simple_icon(output_path="icon.png", size=512):
     """Create a simple icon with 'W' letter."""
-    if not HAS_PIL:
+    if not load_pil():
         print("Pillow not installed. Cannot create icon.")
         return False
     
@@ -58,6 +66,16 @@ def create_simple_icon(output_path="icon.png", size=512):
     print(f"✓ Created {output_path}")
     return True
 
+def resize_cascade(img, sizes):
+    """Resize a square image to each size, largest first, each from the previous result."""
+    resized = {}
+    current = img
+    for size in sorted(set(sizes), reverse=True):
+        if current.size != (size, size):
+            current = current.resize((size, size), Image.Resampling.LANCZOS)
+        resized[size] = current
+    return resized
+
 def create_icns_from_png(png_path, icns_path):
     """Convert PNG to ICNS for macOS (requires iconutil on macOS)."""
     import subprocess
@@ -76,21 +94,24 @@ def create_icns_from_png(png_path, icns_path):
         # Generate required sizes for macOS
         sizes = [16, 32, 64, 128, 256, 512]
         
-        if not HAS_PIL:
+        if not load_pil():
             print("Pillow required to resize icons")
             return False
         
         img = Image.open(png_path)
         
+        # Each pixel size is resampled once, from the next larger one, and
+        # shared between the regular and Retina (@2x) entries that need it.
+        retina_sizes = [size * 2 for size in sizes if size <= 256]
+        resized = resize_cascade(img, sizes + retina_sizes)
+        
         for size in sizes:
             # Regular resolution
-            resized = img.resize((size, size), Image.Resampling.LANCZOS)
-            resized.save(os.path.join(iconset_dir, f"icon_{size}x{size}.png"))
+            resized[size].save(os.path.join(iconset_dir, f"icon_{size}x{size}.png"))
             
             # Retina resolution
             if size <= 256:
-                resized_2x = img.resize((size*2, size*2), Image.Resampling.LANCZOS)
-                resized_2x.save(os.path.join(iconset_dir, f"icon_{size}x{size}@2x.png"))
+                resized[size * 2].save(os.path.join(iconset_dir, f"icon_{size}x{size}@2x.png"))
         
         # Convert to icns using iconutil (macOS only)
         try:
@@ -107,15 +128,18 @@ def create_icns_from_png(png_path, icns_path):
 
 def create_ico_from_png(png_path, ico_path):
     """Convert PNG to ICO for Windows."""
-    if not HAS_PIL:
+    if not load_pil():
         print("Pillow required to create ICO")
         return False
     
     img = Image.open(png_path)
     
-    # Create multiple sizes for Windows
+    # Create multiple sizes for Windows; hand Pillow pre-resized frames so it
+    # does not resample the full-size source again for each one
     sizes = [(16, 16), (32, 32), (48, 48), (256, 256)]
-    img.save(ico_path, format='ICO', sizes=sizes)
+    frames = resize_cascade(img, [size for size, _ in sizes])
+    img.save(ico_path, format='ICO', sizes=sizes,
+             append_images=[frames[size] for size, _ in sizes])
     print(f"✓ Created {ico_path}")
     return True
 
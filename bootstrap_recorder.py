@@ -10,9 +10,10 @@ import json
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from playwright.sync_api import Page, sync_playwright
+if TYPE_CHECKING:
+    from playwright.sync_api import Page
 
 
 DEFAULT_LOGIN = {
@@ -21,6 +22,7 @@ DEFAULT_LOGIN = {
     "submit_selector": "button[type='submit']",
     "success_selector": "body",
 }
+TEXT_INPUT_TYPES = frozenset({"text", "email", "search", "textarea"})
 
 
 def parse_args() -> argparse.Namespace:
@@ -82,19 +84,26 @@ def parse_iso_utc(value: str | None) -> datetime | None:
         return None
 
 
+class SanitizeTable(dict):
+    """str.translate table keeping alphanumerics and "-_." and mapping anything else to "_"."""
+
+    def __missing__(self, codepoint: int) -> int:
+        char = chr(codepoint)
+        mapped = codepoint if char.isalnum() or char in ("-", "_", ".") else ord("_")
+        self[codepoint] = mapped
+        return mapped
+
+
+SANITIZE_TABLE = SanitizeTable()
+
+
 def sanitize_name(value: str) -> str:
-    safe = []
-    for char in value.strip():
-        if char.isalnum() or char in ("-", "_", "."):
-            safe.append(char)
-        else:
-            safe.append("_")
-    return "".join(safe) or "unnamed"
+    return value.strip().translate(SANITIZE_TABLE) or "unnamed"
 
 
-def event_init_script() -> str:
-    # Records interaction details, including change values for login bootstrap.
-    return r"""
+# Records interaction details, including change values for login bootstrap.
+# The script must not contain // comments: it is whitespace-collapsed below.
+EVENT_INIT_SCRIPT_SOURCE = r"""
 (() => {
   if (window.__wbRecorderInstalled) return;
   window.__wbRecorderInstalled = true;
@@ -128,17 +137,29 @@ def event_init_script() -> str:
     return text.slice(0, 120);
   }
 
+  let pending = [];
+
+  function flush() {
+    if (!pending.length) return;
+    const batch = pending;
+    pending = [];
+    if (typeof window.wbRecordEvent === 'function') {
+      window.wbRecordEvent(batch);
+    }
+  }
+
   function emit(payload) {
     const withMeta = {
       ...payload,
       url: window.location.href,
       ts_utc: new Date().toISOString()
     };
-    if (typeof window.wbRecordEvent === 'function') {
-      window.wbRecordEvent(withMeta);
-    }
+    if (!pending.length) queueMicrotask(flush);
+    pending.push(withMeta);
   }
 
+  window.addEventListener('pagehide', flush, true);
+
   document.addEventListener('click', (ev) => {
     const el = ev.target instanceof Element ? ev.target : null;
     emit({
@@ -187,6 +208,13 @@ def event_init_script() -> str:
   }, true);
 })();
 """
+# Chromium compiles the init script for every page and frame, so ship it
+# with whitespace collapsed; the source above stays readable.
+EVENT_INIT_SCRIPT = " ".join(EVENT_INIT_SCRIPT_SOURCE.split())
+
+
+def event_init_script() -> str:
+    return EVENT_INIT_SCRIPT
 
 
 def infer_login_selectors(events: list[dict[str, Any]]) -> dict[str, str]:
@@ -194,7 +222,10 @@ def infer_login_selectors(events: list[dict[str, Any]]) -> dict[str, str]:
     pass_selector = DEFAULT_LOGIN["pass_selector"]
     submit_selector = DEFAULT_LOGIN["submit_selector"]
 
+    # One forward pass: remember the latest text-like change until the first
+    # password change, then look a few events ahead for the submit click.
     password_ix: int | None = None
+    user_event: dict[str, Any] | None = None
     for ix, event in enumerate(events):
         if event.get("type") != "change":
             continue
@@ -203,16 +234,12 @@ def infer_login_selectors(events: list[dict[str, Any]]) -> dict[str, str]:
             pass_selector = str(event.get("selector") or pass_selector)
             password_ix = ix
             break
+        if input_type in TEXT_INPUT_TYPES:
+            user_event = event
 
     if password_ix is not None:
-        for prior in range(password_ix - 1, -1, -1):
-            event = events[prior]
-            if event.get("type") != "change":
-                continue
-            input_type = str(event.get("input_type") or "").lower()
-            if input_type in {"text", "email", "search", "textarea"}:
-                user_selector = str(event.get("selector") or user_selector)
-                break
+        if user_event is not None:
+            user_selector = str(user_event.get("selector") or user_selector)
         for later in range(password_ix + 1, min(password_ix + 16, len(events))):
             event = events[later]
             if event.get("type") in {"click", "dblclick"}:
@@ -247,40 +274,45 @@ def infer_login_credentials(
             username = value
         elif input_type == "password" or (selector and selector == pass_selector):
             password = value
-        elif not username and input_type in {"text", "email", "search", "textarea"}:
+        elif not username and input_type in TEXT_INPUT_TYPES:
             # Fallback: first likely user field before password selector is inferred.
             username = value
 
     return {"username": username, "password": password}
 
 
+def write_json(path: Path, value: Any, *, pretty: bool = False) -> None:
+    # Files people edit (config scaffold, step suggestions) stay indented;
+    # machine-read artifacts are written compact.
+    if pretty:
+        text = json.dumps(value, indent=2)
+    else:
+        text = json.dumps(value, separators=(",", ":"))
+    path.write_bytes(text.encode("utf-8"))
+
+
+def redact_sensitive_event(event: dict[str, Any]) -> dict[str, Any]:
+    scrubbed = dict(event)
+    input_type = str(scrubbed.get("input_type") or "").lower()
+    if input_type == "password" and "value" in scrubbed:
+        value = str(scrubbed.get("value") or "")
+        scrubbed["value"] = f"<redacted:{len(value)} chars>"
+    return scrubbed
+
+
 def redact_sensitive_events(events: list[dict[str, Any]]) -> list[dict[str, Any]]:
-    redacted: list[dict[str, Any]] = []
-    for event in events:
-        scrubbed = dict(event)
-        input_type = str(scrubbed.get("input_type") or "").lower()
-        if input_type == "password" and "value" in scrubbed:
-            value = str(scrubbed.get("value") or "")
-            scrubbed["value"] = f"<redacted:{len(value)} chars>"
-        redacted.append(scrubbed)
-    return redacted
+    return [redact_sensitive_event(event) for event in events]
 
 
 def infer_watch_urls(start_url: str, events: list[dict[str, Any]]) -> list[str]:
-    seen: set[str] = set()
-    ordered: list[str] = []
-    for event in events:
-        if event.get("type") != "navigation" or not event.get("main_frame"):
-            continue
-        url = str(event.get("url") or "").strip()
-        if not url or url == "about:blank" or url in seen:
-            continue
-        seen.add(url)
-        ordered.append(url)
-
-    if not ordered:
-        return [start_url]
-    return ordered
+    # dict.fromkeys de-duplicates while keeping first-seen order.
+    ordered = dict.fromkeys(
+        url
+        for event in events
+        if event.get("type") == "navigation" and event.get("main_frame")
+        if (url := str(event.get("url") or "").strip()) and url != "about:blank"
+    )
+    return list(ordered) or [start_url]
 
 
 def infer_wait_ms_from_event_timing(events: list[dict[str, Any]], index: int) -> int:
@@ -368,6 +400,10 @@ def run_bootstrap(
     if viewport_width < 1 or viewport_height < 1:
         raise ValueError("viewport_width and viewport_height must be >= 1.")
 
+    # Imported here so the helpers above can be used (and tested) without
+    # paying for Playwright's import and driver discovery.
+    from playwright.sync_api import sync_playwright
+
     site_name = sanitize_name(site_name)
     run_root = Path(output_dir) / site_name / utc_timestamp()
     run_root.mkdir(parents=True, exist_ok=False)
@@ -377,10 +413,18 @@ def run_bootstrap(
 
     events: list[dict[str, Any]] = []
     final_screenshot_path = run_root / "final.png"
-    raw_events_path = run_root / "events.json"
+    raw_events_path = run_root / "events.jsonl"
     summary_path = run_root / "summary.json"
 
-    with sync_playwright() as p:
+    # Events are appended to events.jsonl (redacted, one per line) as they are
+    # recorded, so the file can be watched live and survives a crashed session.
+    # They arrive at human pace, so line buffering costs nothing noticeable.
+    with raw_events_path.open("w", encoding="utf-8", buffering=1) as events_file, sync_playwright() as p:
+
+        def add_event(event: dict[str, Any]) -> None:
+            events.append(event)
+            events_file.write(json.dumps(redact_sensitive_event(event), separators=(",", ":")) + "\n")
+
         # Launch browser based on browser_type parameter
         browser = None
         if browser_type == "firefox":
@@ -418,7 +462,8 @@ def run_bootstrap(
             }
         context = browser.new_context(**context_options)
 
-        def record_event(source: Any, payload: dict[str, Any]) -> None:
+        def record_event(source: Any, payload: dict[str, Any] | list[dict[str, Any]]) -> None:
+            # The page sends the events raised within one task as a single batch.
             frame_url = None
             try:
                 frame = source.get("frame")
@@ -426,12 +471,11 @@ def run_bootstrap(
                     frame_url = frame.url
             except Exception:
                 frame_url = None
-            events.append(
-                {
-                    **payload,
-                    "frame_url": frame_url,
-                }
-            )
+            # Playwright deserializes a fresh payload for every call, so the
+            # events can be tagged in place rather than copied.
+            for item in payload if isinstance(payload, list) else [payload]:
+                item["frame_url"] = frame_url
+                add_event(item)
 
         context.expose_binding("wbRecordEvent", record_event)
         context.add_init_script(event_init_script())
@@ -439,7 +483,7 @@ def run_bootstrap(
         page: Page | None = context.new_page()
 
         def on_frame_navigated(frame: Any) -> None:
-            events.append(
+            add_event(
                 {
                     "type": "navigation",
                     "url": frame.url,
@@ -489,8 +533,6 @@ def run_bootstrap(
         context.close()
         browser.close()
 
-    raw_events_path.write_text(json.dumps(redact_sensitive_events(events), indent=2), encoding="utf-8")
-
     inferred_login = infer_login_selectors(events)
     inferred_credentials = infer_login_credentials(
         events,
@@ -551,8 +593,8 @@ def run_bootstrap(
 
     config_out_path.parent.mkdir(parents=True, exist_ok=True)
     steps_out_path.parent.mkdir(parents=True, exist_ok=True)
-    config_out_path.write_text(json.dumps(generated_config, indent=2), encoding="utf-8")
-    steps_out_path.write_text(json.dumps(step_suggestions, indent=2), encoding="utf-8")
+    write_json(config_out_path, generated_config, pretty=True)
+    write_json(steps_out_path, step_suggestions, pretty=True)
 
     summary = {
         "site_name": site_name,
@@ -561,7 +603,7 @@ def run_bootstrap(
         "artifacts_dir": str(run_root),
         "events_recorded": len(events),
     }
-    summary_path.write_text(json.dumps(summary, indent=2), encoding="utf-8")
+    write_json(summary_path, summary)
 
     print("")
     print("Bootstrap capture complete.")
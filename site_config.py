@@ -3,61 +3,96 @@
 # See LICENSE file for full terms
 """Site configuration management for Tkinter UI."""
 
+import functools
 import json
+import logging
 import os
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ModuleNotFoundError:  # Optional: faster config parsing and writing.
+    orjson = None
+
+
+logger = logging.getLogger(__name__)
 
 SITES_DIR = Path("sites")
 CONFIG_SUFFIX = ".config.json"
+SITE_NAME_TABLE = str.maketrans({" ": "_", "/": "_"})
+# Set once SITES_DIR is known to exist; cleared if it turns out to be gone.
+SITES_DIR_READY = False
 
 
 def ensure_sites_dir() -> None:
     """Ensure sites directory exists."""
-    SITES_DIR.mkdir(parents=True, exist_ok=True)
+    global SITES_DIR_READY
+    if not SITES_DIR_READY:
+        SITES_DIR.mkdir(parents=True, exist_ok=True)
+        SITES_DIR_READY = True
+
+
+@functools.lru_cache(maxsize=256)
+def safe_site_name(site_name: str) -> str:
+    """Filesystem-safe form of a site name, used for config and data paths."""
+    return site_name.translate(SITE_NAME_TABLE).lower()
 
 
 def get_site_setup_path(site_name: str) -> Path:
     """Get path to site setup config file."""
-    ensure_sites_dir()
-    safe_name = site_name.replace(" ", "_").replace("/", "_").lower()
-    return SITES_DIR / f"{safe_name}{CONFIG_SUFFIX}"
+    return SITES_DIR / f"{safe_site_name(site_name)}{CONFIG_SUFFIX}"
 
 
 def list_sites() -> list[str]:
     """List all configured sites."""
+    global SITES_DIR_READY
     ensure_sites_dir()
-    sites = []
-    for file in SITES_DIR.glob(f"*{CONFIG_SUFFIX}"):
+    try:
+        entries = os.scandir(SITES_DIR)
+    except FileNotFoundError:
+        # Removed since it was created; recreate it, as there is nothing to list.
+        SITES_DIR_READY = False
+        ensure_sites_dir()
+        return []
+    with entries:
         # Extract site name from filename (remove .config.json)
-        # file.name = "tk3_setup.config.json"
+        # entry.name = "tk3_setup.config.json"
         # Remove the suffix to get "tk3_setup", then convert underscores to spaces to get "tk3 setup"
-        name_without_suffix = file.name.replace(CONFIG_SUFFIX, "")
-        site_name = name_without_suffix.replace("_", " ")
-        sites.append(site_name)
-    return sorted(sites)
+        sites = [
+            entry.name.replace(CONFIG_SUFFIX, "").replace("_", " ")
+            for entry in entries
+            if entry.name.endswith(CONFIG_SUFFIX) and entry.is_file()
+        ]
+    sites.sort()
+    return sites
 
 
 def save_site_config(site_name: str, config: dict[str, Any]) -> None:
     """Save site configuration to JSON file."""
+    # Only writing needs the directory; lookups and deletes just check for the file.
+    ensure_sites_dir()
     path = get_site_setup_path(site_name)
-    path.write_text(json.dumps(config, indent=2))
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+    else:
+        # Stream into the file rather than building the whole document first;
+        # newline="" keeps "\n" line endings on Windows, as write_bytes did.
+        with path.open("w", encoding="utf-8", newline="") as fp:
+            json.dump(config, fp, indent=2)
 
 
 def load_site_config(site_name: str) -> dict[str, Any] | None:
     """Load site configuration from JSON file."""
+    global SITES_DIR_READY
     path = get_site_setup_path(site_name)
     if not path.exists():
-        print(f"DEBUG: Config file not found at {path}")
-        print(f"DEBUG: Current directory: {Path.cwd()}")
-        print(f"DEBUG: Looking for site config for: {site_name}")
-        # List what files DO exist in sites directory
-        if Path("sites").exists():
-            files = list(Path("sites").glob("*_setup.json"))
-            print(f"DEBUG: Found {len(files)} site config files: {[f.name for f in files]}")
+        # The directory may have been removed since it was created.
+        SITES_DIR_READY = False
+        logger.debug("No config for site %r at %s (cwd: %s)", site_name, path, Path.cwd())
         return None
-    return json.loads(path.read_text())
+    raw = path.read_bytes()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
 
 
 def delete_site_config(site_name: str) -> None:
@@ -75,7 +110,7 @@ def create_default_config(
     ignore_https_errors: bool = True,
 ) -> dict[str, Any]:
     """Create a default site configuration."""
-    safe_name = site_name.replace(" ", "_").replace("/", "_").lower()
+    safe_name = safe_site_name(site_name)
     return {
         "site_name": site_name,
         "bootstrap_url": bootstrap_url,
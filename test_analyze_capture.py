@@ -0,0 +1,431 @@
+#!/usr/bin/env python3
+# Copyright (c) 2025-2026 Chris Favre - MIT License
+# See LICENSE file for full terms
+"""
+Tests for the parsing and HTTP helpers in analyze_capture.
+
+Covers the incremental dom.json reader, JSON splicing, batched-answer
+splitting, server-sent event framing, and retries against a local server.
+No API key or network access is needed.
+"""
+
+import contextlib
+import json
+import sys
+import threading
+from dataclasses import replace
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import analyze_capture
+
+PROXY_ENV_VARS = ("http_proxy", "https_proxy", "HTTP_PROXY", "HTTPS_PROXY", "no_proxy", "NO_PROXY")
+
+# Escapes, a surrogate pair, and non-ASCII text, with "text" after a large key
+# and before the (potentially huge) "states" array, as whistleblower.py writes it.
+DOM_TEXT = 'Zone 1 "AHU" \\ path\tTemp 72°F\n☃ snow \U0001F600 ok é' * 3
+DOM_DOC = json.dumps(
+    {"url": "https://bms.example.com/" + "x" * 40, "text": DOM_TEXT, "states": [{"a": [1, 2, {"b": None}]}] * 5}
+)
+
+
+@pytest.fixture(autouse=True)
+def no_proxy_env(monkeypatch):
+    """Keep proxy settings from the environment away from the local test servers."""
+    for name in PROXY_ENV_VARS:
+        monkeypatch.delenv(name, raising=False)
+
+
+@contextlib.contextmanager
+def local_server(handle_post):
+    """Serve POSTs with `handle_post(handler, body)` on 127.0.0.1; yields the endpoint URL."""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            handle_post(self, body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}/v1/responses"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def send_json(handler, status, payload):
+    data = json.dumps(payload).encode("utf-8")
+    handler.send_response(status)
+    handler.send_header("Content-Type", "application/json")
+    handler.send_header("Content-Length", str(len(data)))
+    handler.end_headers()
+    handler.wfile.write(data)
+
+
+def send_fragments(handler, fragments):
+    """Send an event stream with each fragment as its own flushed HTTP chunk."""
+    handler.send_response(200)
+    handler.send_header("Content-Type", "text/event-stream")
+    handler.send_header("Transfer-Encoding", "chunked")
+    handler.end_headers()
+    for fragment in fragments:
+        handler.wfile.write(b"%x\r\n%s\r\n" % (len(fragment), fragment))
+        handler.wfile.flush()
+    handler.wfile.write(b"0\r\n\r\n")
+
+
+def sse_event(payload, newline=b"\n"):
+    data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    return b"event: x" + newline + b"data: " + data + newline + newline
+
+
+def fast_retries(max_retries=3):
+    return analyze_capture.ApiRequestSettings(max_retries=max_retries, connect_timeout=2, read_timeout=5)
+
+
+def test_scan_dom_text_every_prefix():
+    """Partial buffers either ask for more data or already give the right excerpt."""
+    expected_text = json.loads(DOM_DOC)["text"]
+    for max_chars in (1, 7, 15, len(expected_text) - 1, len(expected_text), 10_000):
+        expected = expected_text[:max_chars]
+        for end in range(len(DOM_DOC) + 1):
+            try:
+                value = analyze_capture.scan_dom_text(DOM_DOC[:end], max_chars, at_eof=end == len(DOM_DOC))
+            except analyze_capture.NeedMoreData:
+                assert end < len(DOM_DOC), "NeedMoreData at end of file"
+                continue
+            assert value == expected, f"prefix {end}, max_chars {max_chars}: {value!r}"
+    print("✓ scan_dom_text handles every split point, escape, and surrogate pair")
+
+
+def test_decode_json_string_prefix_cut_inside_escape():
+    """A cut inside \\uXXXX or a surrogate pair is trimmed back to a whole character."""
+    encoded = json.dumps("ab\U0001F600cd\\\"e" * 10)
+    expected = json.loads(encoded)
+    for max_chars in range(1, 12):
+        assert analyze_capture.decode_json_string_prefix(encoded, 0, max_chars, at_eof=True) == expected[:max_chars]
+        truncated = encoded[: len(encoded) - 1]  # No closing quote yet.
+        if len(truncated) - 1 > (max_chars + 2) * analyze_capture.MAX_JSON_CHARS_PER_CHAR:
+            value = analyze_capture.decode_json_string_prefix(truncated, 0, max_chars, at_eof=False)
+            assert value == expected[:max_chars]
+    print("✓ decode_json_string_prefix trims partial escape sequences")
+
+
+def test_read_dom_text_excerpt_small_chunks(tmp_path, monkeypatch):
+    """Reading dom.json a few characters at a time gives the same excerpt as a full parse."""
+    dom_path = tmp_path / "dom.json"
+    dom_path.write_text(DOM_DOC, encoding="utf-8")
+    expected_text = json.loads(DOM_DOC)["text"]
+    for chunk_chars in (1, 3, 7, 64):
+        monkeypatch.setattr(analyze_capture, "DOM_READ_CHUNK_CHARS", chunk_chars)
+        for max_chars in (0, 1, 20, len(expected_text), len(expected_text) + 5):
+            assert analyze_capture.read_dom_text_excerpt(dom_path, max_chars) == expected_text[:max_chars]
+    print("✓ read_dom_text_excerpt matches a full parse for any chunk size")
+
+
+@pytest.mark.parametrize(
+    "document, expected",
+    [
+        ('{"url": "x", "states": []}', ""),
+        ('{"text": null, "states": []}', ""),
+        ('{"text": 42}', "42"),
+        ("{}", ""),
+        ('["not", "an", "object"]', ""),
+        ('  {\n "states": [1, 2],\n "text" : "after states"\n}\n', "after states"),
+    ],
+)
+def test_read_dom_text_excerpt_unusual_documents(tmp_path, document, expected):
+    """Missing, null, non-string, and late "text" values, plus non-object files."""
+    dom_path = tmp_path / "dom.json"
+    dom_path.write_text(document, encoding="utf-8")
+    assert analyze_capture.read_dom_text_excerpt(dom_path, 100) == expected
+
+
+def test_read_dom_text_excerpt_truncated_file(tmp_path):
+    """A dom.json cut off before "text" ends is an error, not a silent empty excerpt."""
+    dom_path = tmp_path / "dom.json"
+    dom_path.write_text(DOM_DOC[: DOM_DOC.index('"text"') + 12], encoding="utf-8")
+    with pytest.raises(ValueError):
+        analyze_capture.read_dom_text_excerpt(dom_path, 10_000)
+    print("✓ truncated dom.json raises ValueError")
+
+
+def test_splice_json_strings():
+    """Spliced values come back out of the JSON exactly, escaped only when needed."""
+    values = ["data:image/png;base64,iVBORw0KGgo+/=", 'quote " and \\ backslash', "line\nbreak é"]
+    placeholders = [f"placeholder-{index}" for index in range(len(values))]
+    payload = {"input": [{"image_url": placeholder, "n": index} for index, placeholder in enumerate(placeholders)]}
+    body = analyze_capture.splice_json_strings(analyze_capture.dump_json_bytes(payload), placeholders, values)
+    decoded = json.loads(body)
+    assert [item["image_url"] for item in decoded["input"]] == values
+    assert [item["n"] for item in decoded["input"]] == [0, 1, 2]
+    assert b"data:image/png;base64,iVBORw0KGgo+/=" in body
+    print("✓ splice_json_strings round-trips placeholders")
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ('["## A", "## B"]', ["## A", "## B"]),
+        ('```json\n["## A ", " ## B"]\n```', ["## A", "## B"]),
+        ('```\n["## A", "## B"]\n```\n', ["## A", "## B"]),
+        ('["## A"]', None),
+        ('["## A", "## B", "## C"]', None),
+        ('["## A", ""]', None),
+        ('["## A", 2]', None),
+        ('{"0": "## A", "1": "## B"}', None),
+        ("Here are the analyses: ## A ## B", None),
+        ('```json\n["## A", "## B"\n```', None),
+        ("", None),
+    ],
+)
+def test_split_batch_response(text, expected):
+    """Well-formed answers split per capture; anything malformed or missing returns None."""
+    assert analyze_capture.split_batch_response(text, 2) == expected
+
+
+def test_streamed_text_across_fragment_boundaries():
+    """SSE events split mid-line, with CRLF endings, comments, and multi-line data."""
+    deltas = ["## Summary\n", "- été ", "\U0001F600 ok"]
+    stream = b"".join(
+        [
+            b": keep-alive comment\n\n",
+            sse_event({"type": "response.created"}),
+            sse_event({"type": "response.output_text.delta", "delta": deltas[0]}, newline=b"\r\n"),
+            sse_event({"type": "response.output_text.delta", "delta": deltas[1]}),
+            b'data: {"type": "response.output_text.delta",\ndata: "delta": '
+            + json.dumps(deltas[2], ensure_ascii=False).encode("utf-8")
+            + b"}\n\n",
+            sse_event({"type": "response.completed", "response": {"output_text": "ignored"}}),
+        ]
+    )
+    # Cut inside "data:", inside a multi-byte character, and between \r and \n.
+    cuts = sorted({1, 5, 30, stream.index(b"\r") + 1, stream.index("é".encode()) + 1, len(stream) - 3})
+    fragments = [stream[start:end] for start, end in zip([0] + cuts, cuts + [len(stream)])]
+
+    with local_server(lambda handler, body: send_fragments(handler, fragments)) as endpoint:
+        received = []
+        status, text = analyze_capture.post_json_bytes(
+            endpoint,
+            b"{}",
+            {},
+            connect_timeout=2,
+            read_timeout=5,
+            read_body=lambda response: analyze_capture.read_streamed_text(response, received.append),
+        )
+    assert status == 200
+    assert received == deltas
+    assert text == ("".join(deltas).strip(), None)
+    print("✓ read_streamed_text reassembles events split across fragments")
+
+
+def test_streamed_text_without_deltas_and_failures():
+    """A completed event alone carries the text; error events raise."""
+    completed = sse_event({"type": "response.completed", "response": {"output_text": " done "}})
+    with local_server(lambda handler, body: send_fragments(handler, [completed, b"data: [DONE]\n\n"])) as endpoint:
+        _, text = analyze_capture.post_json_bytes(
+            endpoint, b"{}", {}, 2, 5, read_body=analyze_capture.read_streamed_text
+        )
+    assert text == ("done", None)
+
+    failed = sse_event({"type": "response.output_text.delta", "delta": "partial"}) + sse_event(
+        {"type": "response.failed"}
+    )
+    with local_server(lambda handler, body: send_fragments(handler, [failed])) as endpoint:
+        with pytest.raises(RuntimeError, match="stream failed"):
+            analyze_capture.post_json_bytes(endpoint, b"{}", {}, 2, 5, read_body=analyze_capture.read_streamed_text)
+    print("✓ read_streamed_text handles completed-only and failed streams")
+
+
+def test_retry_delay_seconds_backoff():
+    """Delays double from the initial delay, are capped, and add up to 1s of jitter."""
+    for attempt in range(8):
+        base = min(
+            analyze_capture.RETRY_MAX_DELAY_SECONDS,
+            analyze_capture.RETRY_INITIAL_DELAY_SECONDS * 2**attempt,
+        )
+        for _ in range(20):
+            assert base <= analyze_capture.retry_delay_seconds(attempt) <= base + 1
+    print("✓ retry_delay_seconds backs off exponentially with a cap")
+
+
+def test_post_with_retries_recovers_from_transient_errors(monkeypatch):
+    """429/503 replies are retried with backoff on the same keep-alive connection."""
+    sleeps = []
+    monkeypatch.setattr(analyze_capture.time, "sleep", sleeps.append)
+    statuses = [503, 429, 200]
+    client_ports = set()
+
+    def handle_post(handler, body):
+        client_ports.add(handler.client_address[1])
+        status = statuses.pop(0)
+        send_json(handler, status, {"output_text": "ok"} if status == 200 else {"error": "busy"})
+
+    with local_server(handle_post) as endpoint:
+        raw = analyze_capture.post_with_retries(endpoint, b"{}", {}, fast_retries())
+    assert json.loads(raw) == {"output_text": "ok"}
+    assert not statuses
+    assert len(sleeps) == 2
+    assert 1 <= sleeps[0] <= 2 <= sleeps[1] <= 3  # 1s then 2s, each plus up to 1s of jitter.
+    assert len(client_ports) == 1, f"expected one pooled connection, saw {len(client_ports)}"
+    print("✓ post_with_retries retries 503/429 on one keep-alive connection")
+
+
+def test_post_with_retries_gives_up(monkeypatch):
+    """Non-retryable statuses fail at once; retryable ones stop after max_retries."""
+    monkeypatch.setattr(analyze_capture.time, "sleep", lambda seconds: None)
+    requests_seen = []
+
+    def handle_post(handler, body):
+        requests_seen.append(handler.path)
+        send_json(handler, int(handler.path.rsplit("/", 1)[1]), {"error": "nope"})
+
+    with local_server(handle_post) as endpoint:
+        base = endpoint.rsplit("/", 1)[0]
+        with pytest.raises(RuntimeError, match="HTTP 400"):
+            analyze_capture.post_with_retries(f"{base}/400", b"{}", {}, fast_retries())
+        assert len(requests_seen) == 1
+
+        requests_seen.clear()
+        with pytest.raises(RuntimeError, match="HTTP 502"):
+            analyze_capture.post_with_retries(f"{base}/502", b"{}", {}, fast_retries(max_retries=2))
+        assert len(requests_seen) == 3
+    print("✓ post_with_retries stops on 4xx and after max_retries")
+
+
+def test_post_with_retries_reconnects_after_server_close(monkeypatch):
+    """A pooled connection the server has since closed is replaced without a retry delay."""
+    sleeps = []
+    monkeypatch.setattr(analyze_capture.time, "sleep", sleeps.append)
+
+    def handle_post(handler, body):
+        send_json(handler, 200, {"output_text": "ok"})
+        handler.close_connection = True  # Close without announcing it, like an idle timeout.
+
+    with local_server(handle_post) as endpoint:
+        for _ in range(3):
+            assert json.loads(analyze_capture.post_with_retries(endpoint, b"{}", {}, fast_retries())) == {
+                "output_text": "ok"
+            }
+    assert sleeps == []
+    print("✓ stale pooled connections are reopened")
+
+
+def test_post_with_retries_does_not_resend_after_read_timeout(monkeypatch):
+    """A request that timed out waiting for the answer is not sent (and billed) again."""
+    monkeypatch.setattr(analyze_capture.time, "sleep", lambda seconds: None)
+    requests_seen = []
+
+    def handle_post(handler, body):
+        requests_seen.append(body)
+        threading.Event().wait(0.5)  # time.sleep is patched out above.
+        send_json(handler, 200, {"output_text": "late"})
+
+    settings = analyze_capture.ApiRequestSettings(connect_timeout=2, read_timeout=0.1)
+    with local_server(handle_post) as endpoint:
+        with pytest.raises(RuntimeError, match="did not answer within 0.1s"):
+            analyze_capture.post_with_retries(endpoint, b"{}", {}, settings)
+    assert len(requests_seen) == 1
+    print("✓ post_with_retries does not resend after a read timeout")
+
+
+def test_call_responses_api_response_cache(tmp_path):
+    """An identical second request is answered from the response cache."""
+    calls = []
+
+    def handle_post(handler, body):
+        calls.append(json.loads(body))
+        send_json(handler, 200, {"output": [{"content": [{"type": "output_text", "text": "## Summary"}]}]})
+
+    settings = analyze_capture.ApiRequestSettings(response_cache_dir=tmp_path, connect_timeout=2, read_timeout=5)
+    request = dict(
+        api_key="test-key",
+        model="test-model",
+        system_prompt="system",
+        user_text="user",
+        image_data_url=None,
+        image_data_urls=["data:image/png;base64,AAAA", "data:image/png;base64,BBBB"],
+        api_settings=settings,
+    )
+    with local_server(handle_post) as endpoint:
+        first = analyze_capture.call_responses_api(endpoint=endpoint, **request)
+        second = analyze_capture.call_responses_api(endpoint=endpoint, **request)
+    assert first == second == ("## Summary", None)
+    assert len(calls) == 1
+    images = [item["image_url"] for item in calls[0]["input"][1]["content"][1:]]
+    assert images == request["image_data_urls"]
+    print("✓ call_responses_api sends spliced images and reuses cached answers")
+
+
+def test_response_cache_refresh_and_incomplete_answers(tmp_path):
+    """Incomplete answers are never cached; a refresh skips the lookup and overwrites the entry."""
+    replies = [
+        {"status": "incomplete", "incomplete_details": {"reason": "max_output_tokens"}, "output_text": "cut"},
+        {"status": "completed", "output_text": "v1"},
+        {"status": "completed", "output_text": "v2"},
+    ]
+    settings = analyze_capture.ApiRequestSettings(response_cache_dir=tmp_path, connect_timeout=2, read_timeout=5)
+    request = dict(
+        api_key="test-key",
+        model="test-model",
+        system_prompt="system",
+        user_text="user",
+        image_data_url=None,
+    )
+    with local_server(lambda handler, body: send_json(handler, 200, replies.pop(0))) as endpoint:
+
+        def call(api_settings):
+            return analyze_capture.call_responses_api(endpoint=endpoint, api_settings=api_settings, **request)
+
+        assert call(settings) == ("cut", "max_output_tokens")
+        assert not list(tmp_path.iterdir())
+        assert call(settings) == ("v1", None)
+        refresh = replace(settings, refresh_response_cache=True)
+        assert call(refresh) == ("v2", None)
+        assert call(settings) == ("v2", None)
+    assert not replies
+    print("✓ the response cache skips incomplete answers and honours refreshes")
+
+
+def test_incomplete_answers_are_flagged(capsys):
+    """Status "incomplete" is reported with its reason on both the streamed and plain paths."""
+    incomplete = {"status": "incomplete", "incomplete_details": {"reason": "max_output_tokens"}}
+    assert analyze_capture.response_incomplete_reason(incomplete) == "max_output_tokens"
+    assert analyze_capture.response_incomplete_reason({"status": "completed"}) is None
+
+    stream = sse_event({"type": "response.output_text.delta", "delta": "cut"}) + sse_event(
+        {"type": "response.incomplete", "response": incomplete}
+    )
+    with local_server(lambda handler, body: send_fragments(handler, [stream])) as endpoint:
+        _, result = analyze_capture.post_json_bytes(
+            endpoint, b"{}", {}, 2, 5, read_body=analyze_capture.read_streamed_text
+        )
+    assert result == ("cut", "max_output_tokens")
+
+    payload = dict(incomplete, output_text="cut")
+    settings = analyze_capture.ApiRequestSettings(connect_timeout=2, read_timeout=5)
+    with local_server(lambda handler, body: send_json(handler, 200, payload)) as endpoint:
+        result = analyze_capture.call_responses_api(
+            api_key="test-key",
+            model="test-model",
+            system_prompt="system",
+            user_text="user",
+            image_data_url=None,
+            endpoint=endpoint,
+            api_settings=settings,
+        )
+    assert result == ("cut", "max_output_tokens")
+    assert "incomplete (max_output_tokens)" in capsys.readouterr().err
+    print("✓ incomplete answers are flagged with their reason")
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))
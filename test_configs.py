@@ -5,18 +5,32 @@
 
 import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-def validate_config(config_path):
-    """Validate a single site config file."""
+try:
+    import orjson
+except ModuleNotFoundError:  # Optional: faster parsing when validating many configs.
+    orjson = None
+
+def read_config_bytes(config_path):
+    """Read a config file's bytes, or None if it cannot be read."""
+    try:
+        return Path(config_path).read_bytes()
+    except OSError:
+        return None
+
+def validate_config(config_path, raw=None):
+    """Validate a single site config file (`raw` is its already-read bytes, if any)."""
     print(f"\n{'='*60}")
     print(f"Testing: {config_path.name}")
     print('='*60)
     
     try:
         # 1. Load and parse JSON
-        with open(config_path) as f:
-            config = json.load(f)
+        if raw is None:
+            raw = Path(config_path).read_bytes()
+        config = orjson.loads(raw) if orjson is not None else json.loads(raw)
         print("✅ JSON syntax valid")
     except json.JSONDecodeError as e:
         print(f"❌ JSON parse error: {e}")
@@ -43,13 +57,11 @@ def validate_config(config_path):
     print(f"✅ Login config valid")
     
     # 4. Check selectors (basic validation)
-    selectors = [
-        login.get("user_selector"),
-        login.get("pass_selector"),
-        login.get("submit_selector"),
-        login.get("success_selector", "body")
-    ]
-    if any(not s or not isinstance(s, str) for s in selectors):
+    user_sel = login.get("user_selector")
+    pass_sel = login.get("pass_selector")
+    submit_sel = login.get("submit_selector")
+    selectors = [user_sel, pass_sel, submit_sel, login.get("success_selector", "body")]
+    if not all(isinstance(s, str) and s for s in selectors):
         print(f"❌ Invalid selectors: {selectors}")
         return False
     print(f"✅ Selectors look valid")
@@ -67,14 +79,14 @@ def validate_config(config_path):
             print(f"   ✓ Target {i}: {target['name']}")
     
     # 6. Detect login pattern
-    user_sel = login.get("user_selector")
-    pass_sel = login.get("pass_selector")
-    
+    user_l = user_sel.lower()
+    pass_l = pass_sel.lower()
+    submit_l = submit_sel.lower()
     # Niagara pattern: input.login-input and #password (often multi-step)
-    if "login-input" in user_sel.lower():
+    if "login-input" in user_l:
         print(f"🔷 Detected: Niagara-style login (multi-step capable)")
     # Trane pattern: #userid, #password, #logon
-    elif "userid" in user_sel.lower() and "password" in pass_sel.lower() and "logon" in login.get("submit_selector", "").lower():
+    elif "userid" in user_l and "password" in pass_l and "logon" in submit_l:
         print(f"🔷 Detected: Trane Tracer Synchrony login (single-step)")
     # Generic pattern
     else:
@@ -98,9 +110,15 @@ def main():
     print("="*60)
     print(f"Found {len(config_files)} config files to test\n")
     
+    # Read the files concurrently, then validate in order so the report
+    # for each config is printed as one uninterrupted block.
+    config_files = sorted(config_files)
+    with ThreadPoolExecutor(max_workers=max(1, min(8, len(config_files)))) as executor:
+        raw_configs = list(executor.map(read_config_bytes, config_files))
+    
     results = {}
-    for config_file in sorted(config_files):
-        valid = validate_config(config_file)
+    for config_file, raw in zip(config_files, raw_configs):
+        valid = validate_config(config_file, raw)
         results[config_file.name] = valid
     
     # Summary
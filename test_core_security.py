@@ -51,7 +51,10 @@ test_events = [
 ]
 
 redacted = bootstrap_recorder.redact_sensitive_events(test_events)
-password_event = [e for e in redacted if e.get("input_type") == "password"][0]
+password_event = next((e for e in redacted if e.get("input_type") == "password"), None)
+if password_event is None:
+    print("✗ No password event in redacted output")
+    sys.exit(1)
 
 if "<redacted:" in password_event["value"] and "secret_pass_123" not in password_event["value"]:
     print(f"✓ Password redaction works: {password_event['value']}")
@@ -161,7 +164,7 @@ print("\n" + "=" * 60)
 print("✓ ALL CORE TESTS PASSED")
 print("=" * 60)
 print("\nSummary:")
-print("  - Bootstrap redacts password from events.json")
+print("  - Bootstrap redacts password from events.jsonl")
 print("  - Bootstrap stores ${WHISTLEBLOWER_PASSWORD} placeholder in config")
 print("  - Whistleblower resolves placeholder from environment")
 print("  - Tkinter UI will prompt for password after bootstrap")
@@ -3,69 +3,89 @@
 # See LICENSE file for full terms
 """Functional compatibility tests for Whistleblower site configs."""
 
-import subprocess
-import sys
-import time
+import contextlib
+import functools
+import io
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-def test_config_execution(config_name, timeout_sec=30):
+import whistleblower
+
+def config_path_for(config_name):
+    """Path of the site config a functional test case runs."""
+    return Path("sites") / f"{config_name}.json"
+
+def test_config_execution(config_name, timeout_sec=30, log=print, config_path=None):
     """Test if whistleblower can run with a given config."""
-    print(f"\n{'='*60}")
-    print(f"FUNCTIONAL TEST: {config_name}")
-    print('='*60)
+    log(f"\n{'='*60}")
+    log(f"FUNCTIONAL TEST: {config_name}")
+    log('='*60)
     
-    config_path = Path("sites") / f"{config_name}.json"
+    if config_path is None:
+        config_path = config_path_for(config_name)
     
     if not config_path.exists():
-        print(f"❌ Config file not found: {config_path}")
+        log(f"❌ Config file not found: {config_path}")
         return False, "File not found"
     
+    return run_config_capture(config_name, config_path, timeout_sec, log)
+
+def run_config_capture(config_name, config_path, timeout_sec, log):
+    """Run one capture for `config_path` and report (success, message)."""
     try:
-        print(f"Running: whistleblower.py --config {config_path}")
-        print(f"Timeout: {timeout_sec} seconds")
-        print("(This will attempt to log in and capture targets)")
-        print("-" * 60)
+        log(f"Running: whistleblower.run_capture(config_path={str(config_path)!r})")
+        log(f"Timeout: {timeout_sec} seconds")
+        log("(This will attempt to log in and capture targets)")
+        log("-" * 60)
         
-        # Run whistleblower with timeout
-        result = subprocess.run(
-            [sys.executable, "whistleblower.py", "--config", str(config_path)],
-            capture_output=True,
-            text=True,
-            timeout=timeout_sec
-        )
+        # Run the capture in-process with a timeout. A capture that overruns
+        # is left to finish on its daemon thread.
+        outcome = {}
         
-        print("STDOUT:")
-        print(result.stdout[-500:] if len(result.stdout) > 500 else result.stdout)
+        def capture():
+            try:
+                outcome["result"] = whistleblower.run_capture(config_path=str(config_path))
+            except Exception as exc:  # noqa: BLE001
+                outcome["error"] = exc
         
-        if result.stderr:
-            print("\nSTDERR:")
-            print(result.stderr[-500:] if len(result.stderr) > 500 else result.stderr)
+        worker = threading.Thread(target=capture, name=f"capture-{config_name}", daemon=True)
+        worker.start()
+        worker.join(timeout_sec)
         
-        # Check exit code
-        if result.returncode == 0:
-            print(f"\n✅ Execution successful (exit code 0)")
+        if worker.is_alive():
+            log(f"⚠️  Timeout after {timeout_sec} seconds")
+            log("   This could mean:")
+            log("   - Network connectivity issue (host unreachable)")
+            log("   - System is responding slowly")
+            log("   - Login credentials incorrect")
+            return False, f"Timeout ({timeout_sec}s) - network/auth expected"
+        
+        if "result" in outcome:
+            log(f"Capture completed: {outcome['result']['run_dir']}")
+            log("\n✅ Execution successful")
             return True, "Success"
-        else:
-            print(f"\n⚠️  Exited with code {result.returncode}")
-            # Some errors are expected (network issues, credentials)
-            # We're mainly testing that whistleblower.py itself works
-            if "ERROR:" in result.stderr or "ERROR:" in result.stdout:
-                return False, f"Error occurred (exit {result.returncode})"
-            else:
-                return True, f"Completed (exit {result.returncode})"
-    
-    except subprocess.TimeoutExpired:
-        print(f"⚠️  Timeout after {timeout_sec} seconds")
-        print("   This could mean:")
-        print("   - Network connectivity issue (host unreachable)")
-        print("   - System is responding slowly")
-        print("   - Login credentials incorrect")
-        return False, f"Timeout ({timeout_sec}s) - network/auth expected"
+        
+        # Some errors are expected (network issues, credentials)
+        # We're mainly testing that whistleblower itself works
+        exc = outcome["error"]
+        log(f"ERROR: {exc}")
+        return False, f"Error occurred ({type(exc).__name__})"
     
     except Exception as e:
-        print(f"❌ Unexpected error: {e}")
+        log(f"❌ Unexpected error: {e}")
         return False, f"Exception: {str(e)}"
 
+def run_case(config_name, timeout_sec, config_path):
+    """Worker-process entry point: run one config and return (result, output)."""
+    output = io.StringIO()
+    log = functools.partial(print, file=output)
+    # Capture run_capture's own prints too, so parallel workers don't
+    # interleave on the shared terminal.
+    with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+        result = test_config_execution(config_name, timeout_sec, log, config_path)
+    return result, output.getvalue()
+
 def main():
     """Run functional tests."""
     print("\n" + "="*60)
@@ -83,10 +103,33 @@ def main():
     
     results = {}
     
-    for config_name, timeout, description in test_cases:
-        print(f"\n{description}")
-        success, message = test_config_execution(config_name, timeout)
-        results[config_name] = (success, message)
+    # Resolve every config up front; missing ones are reported without
+    # starting a worker for them.
+    config_paths = {config_name: config_path_for(config_name) for config_name, _, _ in test_cases}
+    present = {config_name for config_name, path in config_paths.items() if path.exists()}
+    
+    # Run every config at once, each in its own worker process so Playwright
+    # state stays separate and a capture that overruns its timeout is stopped
+    # when the pool shuts down. Output is printed per config, in order.
+    with ProcessPoolExecutor(max_workers=max(1, len(present))) as executor:
+        runs = [
+            (
+                config_name,
+                timeout,
+                description,
+                executor.submit(run_case, config_name, timeout, config_paths[config_name])
+                if config_name in present
+                else None,
+            )
+            for config_name, timeout, description in test_cases
+        ]
+        for config_name, timeout, description, future in runs:
+            if future is None:
+                results[config_name], output = run_case(config_name, timeout, config_paths[config_name])
+            else:
+                results[config_name], output = future.result()
+            print(f"\n{description}")
+            print(output, end="")
     
     # Summary
     print("\n" + "="*60)
@@ -3,6 +3,7 @@
 
 import sys
 import os
+from unittest import mock
 
 # Test 1: Import modules
 print("=" * 60)
@@ -35,15 +36,17 @@ print("\n" + "=" * 60)
 print("TEST 2: Environment variable injection")
 print("=" * 60)
 
-os.environ["WHISTLEBLOWER_PASSWORD"] = "test_password_123"
-retrieved = os.getenv("WHISTLEBLOWER_PASSWORD")
-if retrieved == "test_password_123":
-    print("✓ Environment variable injection works")
-else:
-    print(f"✗ Environment variable retrieval failed: got {retrieved}")
+# patch.dict restores the caller's environment on exit, including any
+# WHISTLEBLOWER_PASSWORD that was already set.
+original_password = os.environ.get("WHISTLEBLOWER_PASSWORD")
+with mock.patch.dict(os.environ, {"WHISTLEBLOWER_PASSWORD": "test_password_123"}):
+    retrieved = os.getenv("WHISTLEBLOWER_PASSWORD")
+    if retrieved == "test_password_123":
+        print("✓ Environment variable injection works")
+    else:
+        print(f"✗ Environment variable retrieval failed: got {retrieved}")
 
-del os.environ["WHISTLEBLOWER_PASSWORD"]
-if "WHISTLEBLOWER_PASSWORD" not in os.environ:
+if os.environ.get("WHISTLEBLOWER_PASSWORD") == original_password:
     print("✓ Environment variable cleanup works")
 else:
     print("✗ Environment variable cleanup failed")
@@ -70,7 +73,10 @@ test_events = [
 
 # Test redaction function
 redacted = bootstrap_recorder.redact_sensitive_events(test_events)
-password_event = [e for e in redacted if e.get("input_type") == "password"][0]
+password_event = next((e for e in redacted if e.get("input_type") == "password"), None)
+if password_event is None:
+    print("✗ No password event in redacted output")
+    sys.exit(1)
 
 if "<redacted:" in password_event["value"]:
     print(f"✓ Password redaction works: {password_event['value']}")
@@ -89,31 +95,29 @@ test_config = {
     }
 }
 
-os.environ["WHISTLEBLOWER_PASSWORD"] = "injected_password"
-resolved = whistleblower.resolve_env_placeholders(test_config)
+with mock.patch.dict(os.environ, {"WHISTLEBLOWER_PASSWORD": "injected_password"}):
+    resolved = whistleblower.resolve_env_placeholders(test_config)
 
-if resolved["login"]["password"] == "injected_password":
-    print("✓ Environment placeholder resolution works")
-else:
-    print(f"✗ Placeholder resolution failed: got {resolved['login']['password']}")
+    if resolved["login"]["password"] == "injected_password":
+        print("✓ Environment placeholder resolution works")
+    else:
+        print(f"✗ Placeholder resolution failed: got {resolved['login']['password']}")
 
-# Test missing env var
-test_config2 = {
-    "login": {
-        "password": "${MISSING_VAR}"
+    # Test missing env var
+    test_config2 = {
+        "login": {
+            "password": "${MISSING_VAR}"
+        }
     }
-}
-
-try:
-    whistleblower.resolve_env_placeholders(test_config2)
-    print("✗ Should have raised error for missing env var")
-except ValueError as e:
-    if "MISSING_VAR" in str(e):
-        print(f"✓ Proper error for missing env var: {e}")
-    else:
-        print(f"✗ Wrong error message: {e}")
 
-del os.environ["WHISTLEBLOWER_PASSWORD"]
+    try:
+        whistleblower.resolve_env_placeholders(test_config2)
+        print("✗ Should have raised error for missing env var")
+    except ValueError as e:
+        if "MISSING_VAR" in str(e):
+            print(f"✓ Proper error for missing env var: {e}")
+        else:
+            print(f"✗ Wrong error message: {e}")
 
 print("\n" + "=" * 60)
 print("✓ ALL TESTS PASSED")
@@ -3,6 +3,7 @@
 
 import sys
 import os
+import tempfile
 from pathlib import Path
 
 print("=" * 60)
@@ -32,19 +33,18 @@ invalid_urls = [
     ""
 ]
 
-for url in valid_urls:
-    if ui_app.is_valid_http_url(url):
-        print(f"  ✓ Valid URL accepted: {url}")
-    else:
-        print(f"  ✗ Valid URL rejected: {url}")
-        sys.exit(1)
+is_valid_url = ui_app.is_valid_http_url
+bad = [url for url in valid_urls if not is_valid_url(url)]
+if bad:
+    print(f"  ✗ Valid URLs rejected: {bad}")
+    sys.exit(1)
+print(f"  ✓ Valid URLs accepted: {valid_urls}")
 
-for url in invalid_urls:
-    if not ui_app.is_valid_http_url(url):
-        print(f"  ✓ Invalid URL rejected: {url}")
-    else:
-        print(f"  ✗ Invalid URL accepted: {url}")
-        sys.exit(1)
+bad = [url for url in invalid_urls if is_valid_url(url)]
+if bad:
+    print(f"  ✗ Invalid URLs accepted: {bad}")
+    sys.exit(1)
+print(f"  ✓ Invalid URLs rejected: {invalid_urls}")
 
 # Test site name validation
 print("\nTesting site name validation:")
@@ -63,19 +63,18 @@ invalid_names = [
     "site with spaces"
 ]
 
-for name in valid_names:
-    if ui_app.is_valid_site_name(name):
-        print(f"  ✓ Valid name accepted: {name}")
-    else:
-        print(f"  ✗ Valid name rejected: {name}")
-        sys.exit(1)
+is_valid_name = ui_app.is_valid_site_name
+bad = [name for name in valid_names if not is_valid_name(name)]
+if bad:
+    print(f"  ✗ Valid names rejected: {bad}")
+    sys.exit(1)
+print(f"  ✓ Valid names accepted: {valid_names}")
 
-for name in invalid_names:
-    if not ui_app.is_valid_site_name(name):
-        print(f"  ✓ Invalid name rejected: {name}")
-    else:
-        print(f"  ✗ Invalid name accepted: {name}")
-        sys.exit(1)
+bad = [name for name in invalid_names if is_valid_name(name)]
+if bad:
+    print(f"  ✗ Invalid names accepted: {bad}")
+    sys.exit(1)
+print(f"  ✓ Invalid names rejected: {len(invalid_names)} cases")
 
 # Test bounded int parsing
 print("\nTesting bounded integer parsing:")
@@ -116,21 +115,18 @@ invalid_paths = [
     "-invalid"
 ]
 
-for path in valid_paths:
-    result = ui_app.normalize_relative_path(path)
-    if result is not None:
-        print(f"  ✓ Valid path accepted: {path}")
-    else:
-        print(f"  ✗ Valid path rejected: {path}")
-        sys.exit(1)
+normalize = ui_app.normalize_relative_path
+bad = [path for path in valid_paths if normalize(path) is None]
+if bad:
+    print(f"  ✗ Valid paths rejected: {bad}")
+    sys.exit(1)
+print(f"  ✓ Valid paths accepted: {valid_paths}")
 
-for path in invalid_paths:
-    result = ui_app.normalize_relative_path(path)
-    if result is None:
-        print(f"  ✓ Invalid path rejected: {path}")
-    else:
-        print(f"  ✗ Invalid path accepted: {path}")
-        sys.exit(1)
+bad = [path for path in invalid_paths if normalize(path) is not None]
+if bad:
+    print(f"  ✗ Invalid paths accepted: {bad}")
+    sys.exit(1)
+print(f"  ✓ Invalid paths rejected: {invalid_paths}")
 
 # Test analysis path security
 print("\n" + "=" * 60)
@@ -140,15 +136,18 @@ print("=" * 60)
 # Test safe path resolution
 print("\nTesting safe analysis path resolution:")
 
-# Create test markdown file structure
-test_data_dir = Path("data/test_analysis")
-test_data_dir.mkdir(parents=True, exist_ok=True)
+# Create test markdown file structure in a private temporary data root,
+# rather than under the working directory's data/ folder.
+temp_dir = tempfile.TemporaryDirectory()
+test_data_root = Path(temp_dir.name) / "data"
+test_data_dir = test_data_root / "test_analysis"
+test_data_dir.mkdir(parents=True)
 
 test_md_file = test_data_dir / "report.md"
 test_md_file.write_text("# Test Report")
 
 # Test valid analysis path
-result = ui_app.resolve_safe_analysis_path("data/test_analysis/report.md")
+result = ui_app.resolve_safe_analysis_path(str(test_md_file), data_root=test_data_root)
 if result is not None and result.name == "report.md":
     print(f"  ✓ Valid analysis path accepted")
 else:
@@ -167,7 +166,7 @@ except:
     print(f"  ✓ Path traversal attempt blocked (exception)")
 
 # Test invalid: wrong file type
-result = ui_app.resolve_safe_analysis_path("data/test_analysis/report.txt")
+result = ui_app.resolve_safe_analysis_path(str(test_data_dir / "report.txt"), data_root=test_data_root)
 if result is None:
     print(f"  ✓ Non-markdown file rejected")
 else:
@@ -175,8 +174,7 @@ else:
     sys.exit(1)
 
 # Clean up
-import shutil
-shutil.rmtree(test_data_dir, ignore_errors=True)
+temp_dir.cleanup()
 
 print("\n" + "=" * 60)
 print("✓ ALL WEB UI SECURITY TESTS PASSED")
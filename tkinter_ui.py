@@ -5,17 +5,20 @@
 
 from __future__ import annotations
 
-import queue
 import sys
 import threading
+from collections import deque
 import tkinter as tk
 from pathlib import Path
 from tkinter import filedialog, messagebox, scrolledtext, ttk
 from typing import Any
 
-import bootstrap_recorder
-import whistleblower
-import analyze_capture
+
+# Oldest log lines are dropped beyond this, so long sessions don't slow the widget.
+MAX_LOG_LINES = 2000
+# Log polling interval: quick while messages are arriving, relaxed when idle.
+LOG_POLL_BUSY_MS = 50
+LOG_POLL_IDLE_MS = 250
 
 
 class WhistleblowerUI:
@@ -30,7 +33,10 @@ class WhistleblowerUI:
         self.bootstrap_thread: threading.Thread | None = None
         self.capture_thread: threading.Thread | None = None
         self.analysis_thread: threading.Thread | None = None
-        self.log_queue: queue.Queue[str] = queue.Queue()
+        # Pending log lines, bounded so a flood from a worker thread drops the
+        # oldest lines instead of growing without limit.
+        self.log_buffer: deque[str] = deque(maxlen=MAX_LOG_LINES)
+        self.log_lock = threading.Lock()
         
         # Browser type variable
         self.browser_var = tk.StringVar(value="chromium")
@@ -43,6 +49,10 @@ class WhistleblowerUI:
     
     def _create_widgets(self) -> None:
         """Create all UI widgets."""
+        # Shared label style, configured once instead of per widget
+        style = ttk.Style(self.root)
+        style.configure("Hint.TLabel", font=("TkDefaultFont", 9, "italic"))
+        
         # Menu bar
         menubar = tk.Menu(self.root)
         self.root.config(menu=menubar)
@@ -77,7 +87,7 @@ class WhistleblowerUI:
         ttk.Label(
             browser_frame,
             text="(Chromium includes Edge on Windows)",
-            font=("TkDefaultFont", 9, "italic"),
+            style="Hint.TLabel",
         ).grid(row=0, column=2, padx=5, sticky=tk.W)
         
         # Notebook (tabs)
@@ -304,22 +314,31 @@ class WhistleblowerUI:
     
     def _log(self, message: str) -> None:
         """Add message to log queue."""
-        self.log_queue.put(message)
+        with self.log_lock:
+            self.log_buffer.append(message)
+    
+    def _call_on_ui(self, fn, *args, **kwargs) -> None:
+        """Run fn(*args, **kwargs) on the Tk main loop (safe from worker threads)."""
+        self.root.after_idle(lambda: fn(*args, **kwargs))
     
     def _process_log_queue(self) -> None:
         """Process log messages from queue."""
-        try:
-            while True:
-                message = self.log_queue.get_nowait()
-                self.log_text.configure(state='normal')
-                self.log_text.insert(tk.END, message + "\n")
-                self.log_text.see(tk.END)
-                self.log_text.configure(state='disabled')
-        except queue.Empty:
-            pass
+        with self.log_lock:
+            messages = list(self.log_buffer)
+            self.log_buffer.clear()
+        
+        # One insert per tick, however many lines arrived since the last one.
+        if messages:
+            self.log_text.configure(state='normal')
+            self.log_text.insert(tk.END, "\n".join(messages) + "\n")
+            excess = int(self.log_text.index("end-1c").split(".")[0]) - 1 - MAX_LOG_LINES
+            if excess > 0:
+                self.log_text.delete("1.0", f"{excess + 1}.0")
+            self.log_text.see(tk.END)
+            self.log_text.configure(state='disabled')
         
         # Schedule next check
-        self.root.after(100, self._process_log_queue)
+        self.root.after(LOG_POLL_BUSY_MS if messages else LOG_POLL_IDLE_MS, self._process_log_queue)
     
     def _clear_log(self) -> None:
         """Clear the log output."""
@@ -345,12 +364,15 @@ class WhistleblowerUI:
             messagebox.showerror("Error", "Please enter a site name")
             return
         
+        # Read once: logged here and handed to the worker below.
+        browser_type = self.browser_var.get()
+        
         # Disable button
         self.bootstrap_btn.config(state='disabled')
         self._log("=== Starting Bootstrap Recording ===")
         self._log(f"URL: {url}")
         self._log(f"Site Name: {site_name}")
-        self._log(f"Browser: {self.browser_var.get()}")
+        self._log(f"Browser: {browser_type}")
         
         # Start thread
         self.bootstrap_thread = threading.Thread(
@@ -363,7 +385,7 @@ class WhistleblowerUI:
                 self.bootstrap_height.get(),
                 self.bootstrap_ignore_https.get(),
                 self.bootstrap_record_video.get(),
-                self.browser_var.get(),
+                browser_type,
             ),
             daemon=True,
         )
@@ -381,6 +403,8 @@ class WhistleblowerUI:
         browser_type: str,
     ) -> None:
         """Run bootstrap recording in background thread."""
+        import bootstrap_recorder
+
         try:
             self._log("Browser window will open. Follow the instructions in the browser console.")
             summary = bootstrap_recorder.run_bootstrap(
@@ -398,13 +422,13 @@ class WhistleblowerUI:
             self._log(f"Steps: {summary['steps_out']}")
             self._log(f"Artifacts: {summary['artifacts_dir']}")
             self._log(f"Events recorded: {summary['events_recorded']}")
-            messagebox.showinfo("Success", "Bootstrap recording completed!")
+            self._call_on_ui(messagebox.showinfo, "Success", "Bootstrap recording completed!")
         except Exception as exc:
             self._log(f"ERROR: {exc}")
-            messagebox.showerror("Error", f"Bootstrap failed: {exc}")
+            self._call_on_ui(messagebox.showerror, "Error", f"Bootstrap failed: {exc}")
         finally:
             # Re-enable button
-            self.root.after(0, lambda: self.bootstrap_btn.config(state='normal'))
+            self._call_on_ui(self.bootstrap_btn.config, state='normal')
     
     def _start_capture(self) -> None:
         """Start capture in a thread."""
@@ -456,6 +480,8 @@ class WhistleblowerUI:
         record_video: bool,
     ) -> None:
         """Run capture in background thread."""
+        import whistleblower
+
         try:
             self._log("Starting capture session...")
             result = whistleblower.run_capture(
@@ -471,13 +497,13 @@ class WhistleblowerUI:
             self._log(f"Output: {result['run_dir']}")
             self._log(f"Site: {result['site_name']}")
             self._log(f"Targets captured: {result['targets_captured']}")
-            messagebox.showinfo("Success", "Capture completed!")
+            self._call_on_ui(messagebox.showinfo, "Success", "Capture completed!")
         except Exception as exc:
             self._log(f"ERROR: {exc}")
-            messagebox.showerror("Error", f"Capture failed: {exc}")
+            self._call_on_ui(messagebox.showerror, "Error", f"Capture failed: {exc}")
         finally:
             # Re-enable button
-            self.root.after(0, lambda: self.capture_btn.config(state='normal'))
+            self._call_on_ui(self.capture_btn.config, state='normal')
     
     def _create_schedule_tab(self) -> None:
         """Create the Schedule tab for recurring captures."""
@@ -591,14 +617,15 @@ class WhistleblowerUI:
         
         self._log("=== Starting Scheduled Captures ===")
         self._log(f"Config: {config_path}")
-        self._log(f"Interval: {self.schedule_interval.get()} minutes")
+        interval_minutes = self.schedule_interval.get()
+        self._log(f"Interval: {interval_minutes} minutes")
         
         self.schedule_thread = threading.Thread(
             target=self._run_schedule_thread,
             args=(
                 config_path,
                 self.schedule_data_dir.get(),
-                self.schedule_interval.get(),
+                interval_minutes,
                 self.schedule_timeout.get(),
                 self.schedule_settle.get(),
             ),
@@ -624,6 +651,8 @@ class WhistleblowerUI:
     ) -> None:
         """Run scheduled captures in background thread."""
         import time
+
+        import whistleblower
         
         capture_count = 0
         try:
@@ -644,7 +673,7 @@ class WhistleblowerUI:
                 
                 # Update status
                 next_in = interval_minutes * 60
-                self.root.after(0, lambda ni=next_in: self.schedule_status.set(f"Next capture in {ni}s"))
+                self._call_on_ui(self.schedule_status.set, f"Next capture in {next_in}s")
                 
                 # Sleep in 1-second intervals to allow quick stopping
                 sleep_remaining = interval_minutes * 60
@@ -652,15 +681,15 @@ class WhistleblowerUI:
                     time.sleep(1)
                     sleep_remaining -= 1
                     if sleep_remaining % 10 == 0 and sleep_remaining > 0:
-                        self.root.after(0, lambda sr=sleep_remaining: self.schedule_status.set(f"Next capture in {sr}s"))
+                        self._call_on_ui(self.schedule_status.set, f"Next capture in {sleep_remaining}s")
         
         except Exception as exc:
             self._log(f"ERROR in scheduler: {exc}")
         finally:
             self.schedule_running = False
-            self.root.after(0, lambda: self.schedule_start_btn.config(state='normal'))
-            self.root.after(0, lambda: self.schedule_stop_btn.config(state='disabled'))
-            self.root.after(0, lambda: self.schedule_status.set("Stopped"))
+            self._call_on_ui(self.schedule_start_btn.config, state='normal')
+            self._call_on_ui(self.schedule_stop_btn.config, state='disabled')
+            self._call_on_ui(self.schedule_status.set, "Stopped")
     
     def _create_analysis_tab(self) -> None:
         """Create the Analysis tab widgets."""
@@ -720,7 +749,7 @@ class WhistleblowerUI:
         ttk.Label(
             api_frame,
             text="(Or set OPENAI_API_KEY / XAI_API_KEY environment variables)",
-            font=("TkDefaultFont", 9, "italic"),
+            style="Hint.TLabel",
         ).grid(row=2, column=0, columnspan=2, pady=5)
         
         # Options
@@ -754,7 +783,7 @@ class WhistleblowerUI:
         self.analysis_end_utc = tk.StringVar(value="")
         ttk.Entry(date_frame, textvariable=self.analysis_end_utc, width=30).grid(row=0, column=3, padx=5, sticky="ew")
         
-        ttk.Label(date_frame, text="(Leave blank for all runs)", font=("TkDefaultFont", 9, "italic")).grid(
+        ttk.Label(date_frame, text="(Leave blank for all runs)", style="Hint.TLabel").grid(
             row=1, column=0, columnspan=4, pady=5
         )
         
@@ -838,6 +867,8 @@ class WhistleblowerUI:
         combine_run: bool,
     ) -> None:
         """Run analysis in background thread."""
+        import analyze_capture
+
         try:
             self._log("Running LLM analysis on capture artifacts...")
             result = analyze_capture.run_analysis(
@@ -856,13 +887,13 @@ class WhistleblowerUI:
             self._log(result['message'])
             for summary in result.get('run_summaries', []):
                 self._log(f"  - {summary['run_dir']}")
-            messagebox.showinfo("Success", "Analysis completed!")
+            self._call_on_ui(messagebox.showinfo, "Success", "Analysis completed!")
         except Exception as exc:
             self._log(f"ERROR: {exc}")
-            messagebox.showerror("Error", f"Analysis failed: {exc}")
+            self._call_on_ui(messagebox.showerror, "Error", f"Analysis failed: {exc}")
         finally:
             # Re-enable button
-            self.root.after(0, lambda: self.analysis_btn.config(state='normal'))
+            self._call_on_ui(self.analysis_btn.config, state='normal')
     
     def _show_about(self) -> None:
         """Show about dialog."""
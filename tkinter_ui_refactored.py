@@ -74,17 +74,14 @@ setup_data_directories()
 
 import json
 import os
-import queue
 import threading
 import tkinter as tk
+from collections import deque
 from datetime import datetime, timedelta
 from pathlib import Path
 from tkinter import filedialog, messagebox, scrolledtext, ttk
 from typing import Any
 
-import analyze_capture
-import bootstrap_recorder
-import whistleblower
 from site_config import (
     create_default_config,
     delete_site_config,
@@ -94,6 +91,12 @@ from site_config import (
     save_site_config,
 )
 
+# Oldest log lines are dropped beyond this, so long sessions don't slow the widget.
+MAX_LOG_LINES = 2000
+# Log polling interval: quick while messages are arriving, relaxed when idle.
+LOG_POLL_BUSY_MS = 50
+LOG_POLL_IDLE_MS = 250
+
 
 class WhistleblowerUIRefactored:
     """Refactored UI optimized for casual BAS users with multi-site support."""
@@ -113,9 +116,12 @@ class WhistleblowerUIRefactored:
         self.bootstrap_running = False
         self.site_password: dict[str, str] = {}  # Store passwords per site in memory
 
-        # Log queue system
-        self.log_queue: queue.Queue[tuple[str, str, bool]] = queue.Queue()
-        self.root.after(100, self._process_log_queue)
+        # Log queue system: pending (action, message, replace_last) entries,
+        # bounded so a flood from a worker thread drops the oldest ones
+        # instead of growing without limit.
+        self.log_buffer: deque[tuple[str, str, bool]] = deque(maxlen=MAX_LOG_LINES)
+        self.log_lock = threading.Lock()
+        self.root.after(LOG_POLL_IDLE_MS, self._process_log_queue)
 
         # Current site configuration
         self.current_site: str | None = None
@@ -129,6 +135,11 @@ class WhistleblowerUIRefactored:
 
     def _create_ui(self) -> None:
         """Create main UI structure."""
+        # Shared label styles, configured once instead of per widget
+        style = ttk.Style(self.root)
+        style.configure("Section.TLabel", font=("TkDefaultFont", 10, "bold"))
+        style.configure("Hint.TLabel", foreground="gray", font=("TkDefaultFont", 9))
+
         main_frame = ttk.Frame(self.root, padding="10")
         main_frame.pack(fill=tk.BOTH, expand=True)
 
@@ -261,7 +272,7 @@ class WhistleblowerUIRefactored:
         
         ttk.Button(button_frame, text="Save API Keys", command=self._save_api_keys, width=20).pack(side=tk.LEFT, padx=5)
         ttk.Label(button_frame, text="Keys are securely stored in your home directory", 
-                 foreground="gray", font=("TkDefaultFont", 9)).pack(side=tk.LEFT, padx=10)
+                 style="Hint.TLabel").pack(side=tk.LEFT, padx=10)
         
         # Info text
         ttk.Label(api_frame, text="Get keys from: OpenAI (platform.openai.com) or xAI (console.x.ai)", 
@@ -345,7 +356,7 @@ class WhistleblowerUIRefactored:
         self.advanced_canvas.bind("<Leave>", lambda e: self.advanced_canvas.unbind_all("<MouseWheel>"))
 
         # Timeout settings
-        ttk.Label(self.advanced_scrollable_frame, text="Timeouts (milliseconds):", font=("TkDefaultFont", 10, "bold")).pack(anchor=tk.W, pady=5)
+        ttk.Label(self.advanced_scrollable_frame, text="Timeouts (milliseconds):", style="Section.TLabel").pack(anchor=tk.W, pady=5)
         
         timeout_frame = ttk.Frame(self.advanced_scrollable_frame)
         timeout_frame.pack(fill=tk.X, padx=20, pady=5)
@@ -367,7 +378,7 @@ class WhistleblowerUIRefactored:
                        variable=self.default_record_video).pack(anchor=tk.W)
 
         # Analysis settings
-        analysis_label = ttk.Label(self.advanced_scrollable_frame, text="Analysis Settings:", font=("TkDefaultFont", 10, "bold"))
+        analysis_label = ttk.Label(self.advanced_scrollable_frame, text="Analysis Settings:", style="Section.TLabel")
         analysis_label.pack(anchor=tk.W, padx=20, pady=10)
         
         self.default_max_dom = tk.IntVar(value=10000)
@@ -406,7 +417,7 @@ class WhistleblowerUIRefactored:
         if threading.current_thread() == threading.main_thread():
             _append()
         else:
-            self.root.after(0, _append)
+            self._call_on_ui(_append)
 
     def _update_api_status(self) -> None:
         """Update API key status indicators."""
@@ -684,7 +695,7 @@ class WhistleblowerUIRefactored:
         self.capture_advanced_frame.grid_remove()  # Hide by default
 
         # Timeout overrides
-        ttk.Label(self.capture_advanced_frame, text="Timeout Overrides:", font=("TkDefaultFont", 10, "bold")).pack(anchor=tk.W, pady=5)
+        ttk.Label(self.capture_advanced_frame, text="Timeout Overrides:", style="Section.TLabel").pack(anchor=tk.W, pady=5)
         
         timeout_override_frame = ttk.Frame(self.capture_advanced_frame)
         timeout_override_frame.pack(fill=tk.X, padx=20, pady=5)
@@ -705,7 +716,7 @@ class WhistleblowerUIRefactored:
         ttk.Spinbox(post_login_frame, from_=0, to=60000, textvariable=self.capture_post_login_override, width=10).pack(side=tk.LEFT, padx=5)
 
         # Browser options
-        ttk.Label(self.capture_advanced_frame, text="Browser Options:", font=("TkDefaultFont", 10, "bold")).pack(anchor=tk.W, padx=20, pady=10)
+        ttk.Label(self.capture_advanced_frame, text="Browser Options:", style="Section.TLabel").pack(anchor=tk.W, padx=20, pady=10)
         
         browser_opts_frame = ttk.Frame(self.capture_advanced_frame)
         browser_opts_frame.pack(fill=tk.X, padx=20, pady=5)
@@ -733,7 +744,7 @@ class WhistleblowerUIRefactored:
         self.capture_stop_btn.pack(side=tk.LEFT, padx=10)
 
         # Capture Status area
-        status_label = ttk.Label(self.capture_tab, text="Capture Status:", font=("TkDefaultFont", 10, "bold"))
+        status_label = ttk.Label(self.capture_tab, text="Capture Status:", style="Section.TLabel")
         status_label.grid(row=7, column=0, columnspan=2, sticky=tk.W, padx=5, pady=(10, 5))
         
         self.capture_status_text = scrolledtext.ScrolledText(
@@ -833,25 +844,25 @@ class WhistleblowerUIRefactored:
         ttk.Checkbutton(personalities_frame, text="BoilerBob (Mechanical Authority)", 
                        variable=self.personality_boilerbob).grid(row=0, column=0, sticky=tk.W, padx=5, pady=2)
         ttk.Label(personalities_frame, text="→ Parses graphical pages for mechanical issues", 
-                 foreground="gray", font=("TkDefaultFont", 9)).grid(row=0, column=1, sticky=tk.W, padx=20)
+                 style="Hint.TLabel").grid(row=0, column=1, sticky=tk.W, padx=20)
         
         self.personality_casey = tk.BooleanVar(value=False)
         ttk.Checkbutton(personalities_frame, text="ConservationCasey (Energy Specialist)", 
                        variable=self.personality_casey).grid(row=1, column=0, sticky=tk.W, padx=5, pady=2)
         ttk.Label(personalities_frame, text="→ Identifies energy savings opportunities and cost reductions", 
-                 foreground="gray", font=("TkDefaultFont", 9)).grid(row=1, column=1, sticky=tk.W, padx=20)
+                 style="Hint.TLabel").grid(row=1, column=1, sticky=tk.W, padx=20)
         
         self.personality_dave = tk.BooleanVar(value=False)
         ttk.Checkbutton(personalities_frame, text="DirectorDave (ROI Strategist)", 
                        variable=self.personality_dave).grid(row=2, column=0, sticky=tk.W, padx=5, pady=2)
         ttk.Label(personalities_frame, text="→ Synthesizes data to develop ROI models for improvements", 
-                 foreground="gray", font=("TkDefaultFont", 9)).grid(row=2, column=1, sticky=tk.W, padx=20)
+                 style="Hint.TLabel").grid(row=2, column=1, sticky=tk.W, padx=20)
         
         self.personality_gary = tk.BooleanVar(value=False)
         ttk.Checkbutton(personalities_frame, text="GraphicalGary (UI Standards) [Experimental]", 
                        variable=self.personality_gary).grid(row=3, column=0, sticky=tk.W, padx=5, pady=2)
         ttk.Label(personalities_frame, text="→ Examines UI consistency against graphical standards", 
-                 foreground="gray", font=("TkDefaultFont", 9)).grid(row=3, column=1, sticky=tk.W, padx=20)
+                 style="Hint.TLabel").grid(row=3, column=1, sticky=tk.W, padx=20)
         
         # Custom Question
         question_frame = ttk.LabelFrame(self.custom_analysis_frame, text="Custom Question (Optional)", padding="5")
@@ -1195,6 +1206,8 @@ Analysis Settings:
         """Run bootstrap in background thread."""
         import tempfile
         import uuid
+
+        import bootstrap_recorder
         
         try:
             # Create temp file PATH (but don't create the file yet)
@@ -1252,20 +1265,18 @@ Analysis Settings:
                     self._log(f"⚠ Password not set for {site_name} - captures may fail if password is required")
                     messagebox.showwarning("Warning", f"No password entered. Captures may fail if password is required.")
             
-            self.root.after(0, prompt_password)
+            self._call_on_ui(prompt_password)
         except Exception as exc:
             self._log(f"ERROR: {exc}")
-            self.root.after(0, lambda: messagebox.showerror("Error", f"Bootstrap failed: {exc}"))
+            self._call_on_ui(messagebox.showerror, "Error", f"Bootstrap failed: {exc}")
         finally:
             self.bootstrap_running = False
             # Clean up flag file
             if hasattr(self, 'bootstrap_flag_file') and self.bootstrap_flag_file:
                 Path(self.bootstrap_flag_file).unlink(missing_ok=True)
             
-            self.root.after(0, lambda: (
-                self.stop_bootstrap_btn.config(state="disabled"),
-                self.init_btn.config(state="normal"),
-            ))
+            self._call_on_ui(self.stop_bootstrap_btn.config, state="disabled")
+            self._call_on_ui(self.init_btn.config, state="normal")
 
     def _start_capture(self) -> None:
         """Start capture (now or schedule)."""
@@ -1305,6 +1316,8 @@ Analysis Settings:
 
     def _run_capture_thread(self, site_name: str, config: dict[str, Any]) -> None:
         """Run capture in background thread."""
+        import whistleblower
+
         try:
             capture_settings = config["capture_settings"]
             bootstrap_file = Path(config["directories"]["bootstrap_artifacts"]) / f"{site_name}.bootstrap.json"
@@ -1312,7 +1325,7 @@ Analysis Settings:
             if not bootstrap_file.exists():
                 self._log(f"ERROR: Bootstrap file not found: {bootstrap_file}")
                 self._log_capture(f"ERROR: Bootstrap file not found: {bootstrap_file}")
-                messagebox.showerror("Error", f"Bootstrap file not found. Initialize site first.")
+                self._call_on_ui(messagebox.showerror, "Error", f"Bootstrap file not found. Initialize site first.")
                 return
             
             # Use advanced settings if enabled
@@ -1361,13 +1374,13 @@ Analysis Settings:
             self._log_capture(f"✓ Capture completed successfully!")
             self._log_capture(f"Targets captured: {result['targets_captured']}")
             self._log_capture(f"Run directory: {result['run_dir']}")
-            messagebox.showinfo("Success", f"Capture completed successfully!\n\nTargets: {result['targets_captured']}\nSaved to: {result['run_dir']}")
+            self._call_on_ui(messagebox.showinfo, "Success", f"Capture completed successfully!\n\nTargets: {result['targets_captured']}\nSaved to: {result['run_dir']}")
         except Exception as exc:
             self._log(f"ERROR: {exc}")
             self._log_capture(f"✗ ERROR: {exc}")
-            messagebox.showerror("Error", f"Capture failed: {exc}")
+            self._call_on_ui(messagebox.showerror, "Error", f"Capture failed: {exc}")
         finally:
-            self.root.after(0, lambda: self.capture_start_btn.config(state="normal"))
+            self._call_on_ui(self.capture_start_btn.config, state="normal")
 
     def _start_schedule(self, site_name: str, config: dict[str, Any]) -> None:
         """Start scheduled recurring captures."""
@@ -1393,6 +1406,8 @@ Analysis Settings:
     def _run_schedule_thread(self, site_name: str, config: dict[str, Any], interval_minutes: int) -> None:
         """Run scheduled captures in background."""
         import time
+
+        import whistleblower
         
         interval_seconds = interval_minutes * 60
         counter = interval_seconds
@@ -1401,7 +1416,7 @@ Analysis Settings:
             remaining_min = counter // 60
             remaining_sec = counter % 60
             status = f"Next capture in {remaining_min}m {remaining_sec}s"
-            self.root.after(0, lambda: self._log(status, replace_last=True))
+            self._call_on_ui(self._log, status, replace_last=True)
             
             if counter <= 0:
                 try:
@@ -1526,6 +1541,8 @@ Analysis Settings:
         self, site_name: str, config: dict[str, Any], provider: str, api_key: str, custom_settings
     ) -> None:
         """Run analysis in background thread."""
+        import analyze_capture
+
         try:
             self._log("Running LLM analysis...")
             
@@ -1637,17 +1654,17 @@ Analysis Settings:
                 # Extract and display analysis text
                 analysis_text = self._extract_analysis_text(result)
                 if analysis_text:
-                    self.root.after(0, lambda: self._display_analysis_results(analysis_text))
+                    self._call_on_ui(self._display_analysis_results, analysis_text)
                 
                 success_msg = "Analysis completed successfully"
                 if result.get('skipped_runs', 0) > 0:
                     success_msg += f"\n({result['skipped_runs']} run(s) skipped due to errors)"
-                messagebox.showinfo("Success", success_msg)
+                self._call_on_ui(messagebox.showinfo, "Success", success_msg)
         except Exception as exc:
             self._log(f"ERROR: {exc}")
-            messagebox.showerror("Error", f"Analysis failed: {exc}")
+            self._call_on_ui(messagebox.showerror, "Error", f"Analysis failed: {exc}")
         finally:
-            self.root.after(0, lambda: self.analysis_btn.config(state="normal"))
+            self._call_on_ui(self.analysis_btn.config, state="normal")
     
     def _extract_analysis_text(self, result: dict[str, Any]) -> str:
         """Extract analysis text from analysis result."""
@@ -1710,28 +1727,50 @@ Analysis Settings:
 
     def _log(self, message: str, replace_last: bool = False) -> None:
         """Add message to log (thread-safe)."""
-        self.log_queue.put(("append", message, replace_last))
+        with self.log_lock:
+            self.log_buffer.append(("append", message, replace_last))
+
+    def _call_on_ui(self, fn, *args, **kwargs) -> None:
+        """Run fn(*args, **kwargs) on the Tk main loop (safe from worker threads)."""
+        self.root.after_idle(lambda: fn(*args, **kwargs))
 
     def _process_log_queue(self) -> None:
         """Process log messages from queue."""
+        pending: list[tuple[str, str, bool]] = []
         try:
-            while True:
-                action, message, replace_last = self.log_queue.get_nowait()
+            # Collect everything queued since the last tick and write it with a
+            # single insert. A replace_last message replaces the previous line,
+            # which is either still pending here or already in the widget.
+            with self.log_lock:
+                pending = list(self.log_buffer)
+                self.log_buffer.clear()
+            lines: list[str] = []
+            replace_widget_last_line = False
+            for action, message, replace_last in pending:
+                if action != "append":
+                    continue
+                if replace_last:
+                    if lines:
+                        lines.pop()
+                    else:
+                        replace_widget_last_line = True
+                lines.append(message)
+            
+            if lines:
+                self.log_output.config(state="normal")
+                if replace_widget_last_line:
+                    # Remove last line
+                    last_line_start = self.log_output.index("end-2l linestart")
+                    self.log_output.delete(last_line_start, tk.END)
                 
-                if action == "append":
-                    self.log_output.config(state="normal")
-                    if replace_last:
-                        # Remove last line
-                        last_line_start = self.log_output.index("end-2l linestart")
-                        self.log_output.delete(last_line_start, tk.END)
-                    
-                    self.log_output.insert(tk.END, message + "\n")
-                    self.log_output.see(tk.END)
-                    self.log_output.config(state="disabled")
-        except queue.Empty:
-            pass
+                self.log_output.insert(tk.END, "\n".join(lines) + "\n")
+                excess = int(self.log_output.index("end-1c").split(".")[0]) - 1 - MAX_LOG_LINES
+                if excess > 0:
+                    self.log_output.delete("1.0", f"{excess + 1}.0")
+                self.log_output.see(tk.END)
+                self.log_output.config(state="disabled")
         finally:
-            self.root.after(100, self._process_log_queue)
+            self.root.after(LOG_POLL_BUSY_MS if pending else LOG_POLL_IDLE_MS, self._process_log_queue)
 
 
 def main() -> None:
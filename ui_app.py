@@ -1370,6 +1370,8 @@ class UIHandler(BaseHTTPRequestHandler):
             cmd.extend(["--prompt", prompt])
         if "analysis_combine_run" in data:
           cmd.append("--combine-run")
+        # Each click from the UI is a request for a fresh answer.
+        cmd.append("--no-response-cache")
         cmd.extend(["--provider", provider])
 
         if provider == "openai":
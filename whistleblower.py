@@ -123,13 +123,20 @@ def require_keys(data: dict[str, Any], keys: list[str], context: str) -> None:
         raise ValueError(f"Missing keys in {context}: {', '.join(missing)}")
 
 
+# A config string that is exactly `${NAME}` (surrounding whitespace allowed).
+ENV_PLACEHOLDER_RE = re.compile(r"\s*\$\{([A-Z0-9_]+)\}\s*")
+
+
 def resolve_env_placeholders(value: Any) -> Any:
     if isinstance(value, dict):
         return {k: resolve_env_placeholders(v) for k, v in value.items()}
     if isinstance(value, list):
         return [resolve_env_placeholders(v) for v in value]
     if isinstance(value, str):
-        match = re.fullmatch(r"\$\{([A-Z0-9_]+)\}", value.strip())
+        # Most config strings are selectors and URLs; skip the regex for them.
+        if "${" not in value:
+            return value
+        match = ENV_PLACEHOLDER_RE.fullmatch(value)
         if match is None:
             return value
         env_key = match.group(1)
@@ -273,14 +280,21 @@ def utc_timestamp() -> str:
     return datetime.now(timezone.utc).strftime("%Y%m%d-%H%M%S")
 
 
+class SanitizeTable(dict):
+    """str.translate table keeping alphanumerics and "-_." and mapping anything else to "_"."""
+
+    def __missing__(self, codepoint: int) -> int:
+        char = chr(codepoint)
+        mapped = codepoint if char.isalnum() or char in ("-", "_", ".") else ord("_")
+        self[codepoint] = mapped
+        return mapped
+
+
+SANITIZE_TABLE = SanitizeTable()
+
+
 def sanitize_name(value: str) -> str:
-    safe = []
-    for char in value.strip():
-        if char.isalnum() or char in ("-", "_", "."):
-            safe.append(char)
-        else:
-            safe.append("_")
-    return "".join(safe) or "unnamed"
+    return value.strip().translate(SANITIZE_TABLE) or "unnamed"
 
 
 def make_run_dir(data_dir: Path, site_name: str) -> Path: